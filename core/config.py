@@ -1,18 +1,31 @@
 """Configuration models and encrypted persistence utilities for the MinerU client."""
 
-import json
+import os
 from pathlib import Path
-from typing import Any, Dict
 
-from cryptography.fernet import Fernet
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
+try:  # Prefer the Rust-backed implementation; both follow the same Fernet spec.
+    from rfernet import Fernet as _RustFernet
+except ImportError:  # pragma: no cover - depends on installed wheels
+    _RustFernet = None
+    from cryptography.fernet import Fernet as _PyFernet
 
 CONFIG_FILE_NAME = "config.json"
 CONFIG_KEY_FILE = "key.key"
 CONFIG_VERSION = 1
 
 
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a sibling temp file and swap it into place in one step."""
+    temp_path = path.with_name(f"{path.name}.tmp")
+    with temp_path.open("wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+
+
 class AppOptions(BaseModel):
     """Fine-grained user configurable options that mirror API request flags."""
 
@@ -24,7 +37,8 @@ class AppOptions(BaseModel):
     auto_retry: bool = Field(default=True, description="Automatically retry failed uploads.")
     max_retry_attempts: int = Field(default=2, ge=0, le=5, description="Automatic retry attempts per file.")
 
-    @validator("language")
+    @field_validator("language")
+    @classmethod
     def validate_language(cls, value: str) -> str:
         """Normalise missing language hints to the default Chinese shorthand."""
         if not value:
@@ -41,21 +55,50 @@ class AppConfig(BaseModel):
     options: AppOptions = Field(default_factory=AppOptions)
     history_limit: int = Field(default=20, ge=1, le=200, description="How many task history entries to persist.")
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialise the configuration to a plain dictionary."""
-        return self.model_dump()
-
     @classmethod
-    def from_dict(cls, payload: Dict[str, Any]) -> "AppConfig":
-        """Create a configuration instance while tolerating legacy payloads."""
-        if not payload:
-            return cls()
-        # Accept legacy payloads without version/options fields
-        if "options" not in payload:
-            payload["options"] = {}
-        if "version" not in payload:
-            payload["version"] = 0
-        return cls(**payload)
+    def from_json(cls, raw: bytes) -> "AppConfig":
+        """Parse and validate raw JSON in a single pydantic-core pass."""
+        try:
+            config = cls.model_validate_json(raw)
+        except ValidationError as err:
+            # null or any other non-object document is treated like an empty config
+            if any(error["type"] == "model_type" and not error["loc"] for error in err.errors()):
+                return cls()
+            raise
+        # Accept legacy payloads without a version field
+        if "version" not in config.model_fields_set:
+            config.version = 0
+        return config
+
+
+class TokenCipher:
+    """Thin Fernet facade hiding the API differences between rfernet and cryptography."""
+
+    def __init__(self, key: bytes) -> None:
+        """Build the underlying Fernet instance from a urlsafe base64 key."""
+        key = key.strip()
+        if _RustFernet is not None:
+            self._fernet = _RustFernet(key.decode("ascii"))
+        else:
+            self._fernet = _PyFernet(key)
+
+    @staticmethod
+    def generate_key() -> bytes:
+        """Return a freshly generated Fernet key encoded as bytes."""
+        if _RustFernet is not None:
+            return _RustFernet.generate_new_key().encode("ascii")
+        return _PyFernet.generate_key()
+
+    def encrypt(self, plaintext: str) -> str:
+        """Encrypt text and return the Fernet token as a string."""
+        token = self._fernet.encrypt(plaintext.encode())
+        return token if isinstance(token, str) else token.decode()
+
+    def decrypt(self, token: str) -> str:
+        """Decrypt a Fernet token string back into plain text."""
+        if _RustFernet is not None:
+            return self._fernet.decrypt(token).decode()
+        return self._fernet.decrypt(token.encode()).decode()
 
 
 class ConfigManager:
@@ -67,6 +110,11 @@ class ConfigManager:
         base_dir = resolved_config.parent if resolved_config else Path(".")
         self._config_path = resolved_config if resolved_config else base_dir / CONFIG_FILE_NAME
         self._key_path = Path(key_path).expanduser() if key_path else base_dir / CONFIG_KEY_FILE
+        self._cipher: TokenCipher | None = None
+        self._key_mtime: int | None = None
+        # (cipher, plain key, token) of the last encrypted API key, plus the last bytes on disk
+        self._token_cache: tuple[TokenCipher, str, str] | None = None
+        self._last_written: bytes | None = None
         self._ensure_key_exists()
 
     @property
@@ -82,39 +130,55 @@ class ConfigManager:
     def _ensure_key_exists(self) -> None:
         """Create a new Fernet key if no encryption key exists yet."""
         if not self._key_path.exists():
-            key = Fernet.generate_key()
-            self._key_path.write_bytes(key)
+            key = TokenCipher.generate_key()
+            write_bytes_atomic(self._key_path, key)
 
-    def _get_cipher(self) -> Fernet:
-        """Read the Fernet key from disk and build a cipher instance."""
-        key = self._key_path.read_bytes()
-        return Fernet(key)
+    def _get_cipher(self) -> TokenCipher:
+        """Return the cached cipher, rebuilding it only when the key file changes."""
+        key_mtime = self._key_path.stat().st_mtime_ns
+        if self._cipher is None or key_mtime != self._key_mtime:
+            self._cipher = TokenCipher(self._key_path.read_bytes())
+            self._key_mtime = key_mtime
+        return self._cipher
 
     def load(self) -> AppConfig:
         """Load configuration, decrypting the API key when necessary."""
         if not self._config_path.exists():
             return AppConfig()
 
-        with self._config_path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        raw = self._config_path.read_bytes()
+        config = AppConfig.from_json(raw)
+        self._last_written = raw
 
-        if payload.get("api_key"):
-            cipher = self._get_cipher()
+        if config.api_key:
+            token = config.api_key
             try:
-                payload["api_key"] = cipher.decrypt(payload["api_key"].encode()).decode()
+                cipher = self._get_cipher()
+                config.api_key = cipher.decrypt(token)
+                self._token_cache = (cipher, config.api_key, token)
             except Exception:
-                # Fallback to plain text if decryption fails (legacy configs)
+                # Fallback to plain text if the key or token is invalid (legacy configs)
                 pass
 
-        return AppConfig.from_dict(payload)
+        return config
 
     def save(self, config: AppConfig) -> None:
         """Persist configuration while encrypting the API key on disk."""
-        payload = config.to_dict()
-        cipher = self._get_cipher()
+        if config.api_key:
+            config = config.model_copy(update={"api_key": self._encrypt_api_key(config.api_key)})
 
-        if payload.get("api_key"):
-            payload["api_key"] = cipher.encrypt(payload["api_key"].encode()).decode()
+        data = config.model_dump_json(indent=2).encode("utf-8")
+        if data == self._last_written and self._config_path.exists():
+            return
+        write_bytes_atomic(self._config_path, data)
+        self._last_written = data
 
-        with self._config_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False, indent=2)
+    def _encrypt_api_key(self, api_key: str) -> str:
+        """Encrypt the API key, reusing the previous token while key and cipher are unchanged."""
+        cipher = self._get_cipher()
+        cached = self._token_cache
+        if cached and cached[0] is cipher and cached[1] == api_key:
+            return cached[2]
+        token = cipher.encrypt(api_key)
+        self._token_cache = (cipher, api_key, token)
+        return token
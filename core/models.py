@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -9,6 +11,15 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 
+def path_key(path: Path | str) -> str:
+    """Return the absolute path string that identifies a local file across the UI.
+
+    Purely lexical (no symlink resolution, no filesystem access). Case is kept
+    because the key doubles as the upload path, whose name becomes the display name.
+    """
+    return os.path.abspath(os.path.expanduser(path))
+
+
 class TaskStatus(str, Enum):
     """Runtime lifecycle states for individual upload files."""
 
@@ -30,7 +41,7 @@ class HistoryStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class UploadFile:
     """Representation of a single file tracked through upload and parsing phases."""
 
@@ -42,6 +53,16 @@ class UploadFile:
     attempts: int = 0
     remote_id: Optional[str] = None
 
+    @property
+    def stem(self) -> str:
+        """Display name without its final suffix."""
+        return Path(self.display_name).stem
+
+    @property
+    def resolved_key(self) -> str:
+        """Absolute path key (see path_key) identifying this file."""
+        return path_key(self.path)
+
     def as_dict(self) -> Dict[str, str | int | None]:
         """Return a serialisable snapshot useful for UI widgets."""
         return {
@@ -56,7 +77,7 @@ class UploadFile:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchTask:
     """Aggregate unit describing an API batch upload session."""
 
@@ -71,16 +92,20 @@ class BatchTask:
         """Stamp the task with the completion timestamp."""
         self.completed_at = datetime.utcnow()
 
+    def status_counts(self) -> Counter:
+        """Tally files per status in a single pass."""
+        return Counter(f.status for f in self.files)
+
     def success_count(self) -> int:
         """Count files that completed successfully."""
-        return sum(1 for f in self.files if f.status == TaskStatus.COMPLETED)
+        return self.status_counts()[TaskStatus.COMPLETED]
 
     def failure_count(self) -> int:
         """Count files that ended in an error state."""
-        return sum(1 for f in self.files if f.status == TaskStatus.FAILED)
+        return self.status_counts()[TaskStatus.FAILED]
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryEntry:
     """Persisted batch summary surfaced in the task history UI."""
 
@@ -94,7 +119,7 @@ class HistoryEntry:
     last_error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiError(Exception):
     """Wrapper for API errors that preserves server metadata and status codes."""
 
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import mmap
+import os
+import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Iterable, List, Optional, Tuple
 
-import requests
-from requests import Session
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import orjson
 
 from core.models import ApiError, UploadFile
 from core.config import AppOptions
 from services.logger import get_logger
 
+if TYPE_CHECKING:  # requests is imported lazily when the first request is made
+    import requests
+    from requests import Session
+
 
 logger = get_logger("api_client")
 
@@ -32,28 +36,56 @@ class MinerUApiClient:
     """HTTP client wrapper for interacting with the MinerU API."""
 
     BASE_URL = "https://mineru.net/api/v4"
+    UPLOAD_MMAP_THRESHOLD = 1 << 20
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+    DOWNLOAD_SPOOL_SIZE = 32 << 20
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 32
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    RETRY_METHODS = frozenset({"GET", "POST", "PUT"})
+
+    _shared_session: Optional[Session] = None
+    _session_lock = threading.Lock()
 
     def __init__(self, api_key: str, timeout: int = 30) -> None:
         """Configure a session with MinerU-specific headers and timeouts."""
         self._timeout = timeout
-        self._session = self._build_session()
         self._headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {api_key}",
         }
 
-    def _build_session(self) -> Session:
+    @classmethod
+    def _get_session(cls) -> Session:
+        """Return the process-wide session so pooled connections survive client swaps."""
+        if cls._shared_session is None:
+            with cls._session_lock:
+                if cls._shared_session is None:
+                    cls._shared_session = cls._build_session()
+        return cls._shared_session
+
+    @classmethod
+    def _build_session(cls) -> Session:
         """Return a requests session preloaded with exponential backoff retries."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         session = requests.Session()
         retry = Retry(
             total=4,
             read=4,
             connect=4,
             backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT"],
+            status_forcelist=cls.RETRY_STATUS_CODES,
+            allowed_methods=cls.RETRY_METHODS,
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=cls.POOL_CONNECTIONS,
+            pool_maxsize=cls.POOL_MAXSIZE,
+            pool_block=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         return session
@@ -62,34 +94,29 @@ class MinerUApiClient:
         """Decode JSON responses and raise descriptive errors when necessary."""
         if response.ok:
             try:
-                return response.json()
-            except json.JSONDecodeError as err:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError as err:
                 raise ApiError("Failed to parse API response", response.status_code) from err
         try:
-            payload = response.json()
+            payload = orjson.loads(response.content)
             message = payload.get("msg") or payload.get("message") or response.text
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             payload = None
             message = response.text
         raise ApiError(message, response.status_code, payload)
 
     def create_batch(self, files: Iterable[UploadFile], options: AppOptions) -> BatchCreationResult:
         """Ask the API for upload URLs corresponding to the provided files."""
+        is_ocr = options.is_ocr
         payload = {
             "enable_formula": options.enable_formula,
             "enable_table": options.enable_table,
             "language": options.language,
-            "files": [
-                {
-                    "name": file.display_name,
-                    "is_ocr": options.is_ocr,
-                }
-                for file in files
-            ],
+            "files": [{"name": file_item.display_name, "is_ocr": is_ocr} for file_item in files],
         }
 
         logger.info("Creating batch for %d files", len(payload["files"]))
-        response = self._session.post(
+        response = self._get_session().post(
             f"{self.BASE_URL}/file-urls/batch",
             headers=self._headers,
             json=payload,
@@ -107,14 +134,21 @@ class MinerUApiClient:
         return BatchCreationResult(batch_id=batch_id, file_urls=file_urls)
 
     def upload_file(self, signed_url: str, file_path: Path) -> None:
-        """Upload raw bytes to the signed storage URL provided by the API."""
+        """Upload raw bytes to the signed storage URL provided by the API.
+
+        Signed URLs are HTTPS, so the kernel cannot sendfile() into the TLS socket;
+        large files are memory-mapped instead, which avoids copying into Python buffers.
+        """
         logger.debug("Uploading %s", file_path)
         with file_path.open("rb") as handle:
-            response = self._session.put(
-                signed_url,
-                data=handle,
-                timeout=self._timeout,
-            )
+            size = os.fstat(handle.fileno()).st_size
+            if size > self.UPLOAD_MMAP_THRESHOLD:
+                # Hand the mapped pages to sendall() in one go instead of 8 KiB reads.
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as body:
+                        response = self._put_upload(signed_url, body, size)
+            else:
+                response = self._put_upload(signed_url, handle.read(), size)
         if not response.ok:
             raise ApiError(
                 f"Failed to upload {file_path.name}",
@@ -122,9 +156,18 @@ class MinerUApiClient:
                 {"response": response.text},
             )
 
+    def _put_upload(self, signed_url: str, body: bytes | memoryview, size: int) -> requests.Response:
+        """PUT an in-memory body with an explicit length to avoid chunked transfer."""
+        return self._get_session().put(
+            signed_url,
+            data=body,
+            headers={"Content-Length": str(size)},
+            timeout=self._timeout,
+        )
+
     def fetch_batch_status(self, batch_id: str) -> dict:
         """Query the API for the latest extraction state of a batch."""
-        response = self._session.get(
+        response = self._get_session().get(
             f"{self.BASE_URL}/extract-results/batch/{batch_id}",
             headers=self._headers,
             timeout=self._timeout,
@@ -134,14 +177,34 @@ class MinerUApiClient:
             raise ApiError(data.get("msg", "Failed to fetch batch status"), response.status_code, data)
         return data
 
-    def download_result(self, url: str) -> bytes:
-        """Download the final ZIP bundle once parsing has finished."""
-        response = self._session.get(url, timeout=self._timeout, stream=True)
+    def download_result(self, url: str) -> BinaryIO:
+        """Stream the final ZIP bundle into a seekable spool file positioned at the start.
+
+        Small packages stay in memory; larger ones spill to a temporary file so peak
+        memory stays bounded by the spool threshold. The caller owns (and closes) the file.
+        """
+        response = self._get_session().get(url, timeout=self._timeout, stream=True)
         if not response.ok:
+            # A streamed response holds its pooled connection until closed.
+            response.close()
             raise ApiError("Failed to download result package", response.status_code, {"url": url})
 
-        content = bytearray()
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                content.extend(chunk)
-        return bytes(content)
+        spool = tempfile.SpooledTemporaryFile(max_size=self.DOWNLOAD_SPOOL_SIZE)
+        try:
+            total = int(response.headers.get("Content-Length") or 0)
+            encoding = response.headers.get("Content-Encoding", "identity").lower()
+            if encoding == "identity" and total > self.DOWNLOAD_SPOOL_SIZE:
+                spool.rollover()
+            written = 0
+            for chunk in response.raw.stream(self.DOWNLOAD_CHUNK_SIZE, decode_content=True):
+                spool.write(chunk)
+                written += len(chunk)
+            if encoding == "identity" and total and written != total:
+                raise ApiError("Result package download was truncated", response.status_code, {"url": url})
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        finally:
+            response.close()
+        return spool
@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-import copy
-import io
-import json
+import os
 import shutil
-import time
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional
 from zipfile import ZipFile
 
-from PySide6.QtCore import QObject, QThread, Signal
+import orjson
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
 
-from core.config import AppConfig, AppOptions
+from core.config import AppConfig, AppOptions, write_bytes_atomic
 from core.models import BatchTask, HistoryStatus, TaskStatus, UploadFile
 from services.api_client import MinerUApiClient
 from services.logger import get_logger
@@ -22,6 +22,9 @@ from services.logger import get_logger
 
 logger = get_logger("task_manager")
 
+_HISTORY_COMPLETED = HistoryStatus.COMPLETED.value
+_HISTORY_UNKNOWN = HistoryStatus.UNKNOWN.value
+
 
 def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
     """Convert an ISO 8601 string to a datetime, returning None on failure."""
@@ -37,36 +40,273 @@ def _store_result_package(
     task: BatchTask,
     output_root: Path,
     file_item: UploadFile,
-    package_bytes: bytes,
+    package: BinaryIO,
     log_callback: Callable[[str], None],
 ) -> Path:
     """Extract a result ZIP into the batch folder and mirror the markdown summary."""
     batch_root = task.output_dir or (output_root / (task.batch_id or "batch"))
-    file_stem = Path(file_item.display_name).stem
+    file_stem = file_item.stem
     target_dir = batch_root / file_stem
-    if target_dir.exists():
-        shutil.rmtree(target_dir)
+    # Re-extractions overwrite in place and only prune what the new package no longer has.
+    reused = target_dir.exists()
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    buffer = io.BytesIO(package_bytes)
     md_candidate = None
-    with ZipFile(buffer) as archive:
-        archive.extractall(target_dir)
-        for member in archive.namelist():
-            if Path(member).name == "full.md":
-                md_candidate = target_dir / Path(member)
-                break
-
-    if md_candidate and md_candidate.exists():
-        markdown_target = batch_root / f"{file_stem}.md"
-        shutil.copyfile(md_candidate, markdown_target)
+    extracted_paths = set()
+    with ZipFile(package) as archive:
+        # Extract and look for full.md in the same walk over the central directory.
+        for info in archive.infolist():
+            extracted = archive.extract(info, target_dir)
+            extracted_paths.add(os.path.normpath(extracted))
+            if md_candidate is None and info.filename.rsplit("/", 1)[-1] == "full.md":
+                md_candidate = extracted
+    if reused:
+        _prune_stale_entries(target_dir, extracted_paths)
+
+    if md_candidate and os.path.isfile(md_candidate):
+        _mirror_file(Path(md_candidate), batch_root / f"{file_stem}.md")
     else:
         log_callback(f"警告：{file_item.display_name} 的结果中未找到 full.md")
 
     return target_dir
 
 
-class BatchWorker(QThread):
+def _prune_stale_entries(root: Path, keep: set) -> None:
+    """Remove files under root that are not in keep, plus directories left empty.
+
+    ``keep`` holds normalised paths, so the walk starts from the normalised root too.
+    """
+    for dirpath, dirnames, filenames in os.walk(os.path.normpath(root), topdown=False):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if path not in keep:
+                os.unlink(path)
+        for dirname in dirnames:
+            path = os.path.join(dirpath, dirname)
+            if path not in keep:
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    pass  # still holds extracted files
+
+
+def _progress_signature(extract_result: List[dict]) -> tuple:
+    """Summarise the per-file state and page progress reported by one status poll."""
+    return tuple(
+        (item.get("file_name"), item.get("state"), (item.get("extract_progress") or {}).get("extracted_pages"))
+        for item in extract_result
+    )
+
+
+def _next_poll_interval(current: float, changed: bool, minimum: float, maximum: float) -> float:
+    """Reset to the fastest cadence on progress, otherwise back off by half again."""
+    if changed:
+        return minimum
+    return min(maximum, current * 1.5)
+
+
+def _mirror_file(source: Path, target: Path) -> None:
+    """Hard-link target to source when possible, falling back to a byte copy."""
+    try:
+        target.unlink(missing_ok=True)
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+class _PollingMixin:
+    """File state machine shared by workers that poll a batch's extract results.
+
+    Hosts must provide ``_task``, ``_api_client``, ``_output_dir``, ``_cancel_event``,
+    ``_last_emitted``, ``_last_progress`` and the worker signals.
+    """
+
+    POLL_INTERVAL_MIN = 1.0
+    POLL_INTERVAL_MAX = 15.0
+    DOWNLOAD_WORKERS = 4
+    CANCEL_CHECK_INTERVAL = 0.2
+
+    STATES_FAILED = frozenset({"failed", "error"})
+    STATES_WAITING = frozenset({"pending", "queued", "waiting-file"})
+    STATES_RUNNING = frozenset({"running", "processing"})
+
+    @property
+    def _is_cancelled(self) -> bool:
+        """Return True once cancellation has been requested."""
+        return self._cancel_event.is_set()
+
+    def _wait_first(self, futures: Iterable[Future]) -> set:
+        """Block until at least one future finishes or cancellation is requested.
+
+        Returns the finished futures (empty when cancelled first).
+        """
+        while not self._is_cancelled:
+            done, _ = wait(futures, timeout=self.CANCEL_CHECK_INTERVAL, return_when=FIRST_COMPLETED)
+            if done:
+                return done
+        return set()
+
+    def _emit_progress(self, value: int) -> None:
+        """Emit progress_updated only when the clamped, never-decreasing percentage changes."""
+        value = max(self._last_progress, min(100, int(value)))
+        if value != self._last_progress:
+            self._last_progress = value
+            self.progress_updated.emit(value)
+
+    def _emit_file_update(self, file_item: UploadFile) -> None:
+        """Emit file_updated only when the file's visible state actually changed."""
+        snapshot = (file_item.status, file_item.progress_label, file_item.error, file_item.attempts)
+        if self._last_emitted.get(file_item.display_name) == snapshot:
+            return
+        self._last_emitted[file_item.display_name] = snapshot
+        self.file_updated.emit(file_item.display_name, file_item)
+
+    def _poll_pending(self, pending: Dict[str, UploadFile]) -> None:
+        """Poll until every pending file reaches a terminal state, then finish the batch.
+
+        Finished results are downloaded on a small pool so polling keeps going meanwhile.
+        """
+        total_files = len(self._task.files) or 1
+        poll_interval = self.POLL_INTERVAL_MIN
+        last_signature = None
+        last_pending_count = None
+        # Files finished before polling started (e.g. on resume) count towards progress.
+        completed = self._task.success_count()
+        in_flight: Dict[Future, UploadFile] = {}
+        with ThreadPoolExecutor(max_workers=self.DOWNLOAD_WORKERS, thread_name_prefix="mineru-download") as pool:
+            while (pending or in_flight) and not self._is_cancelled:
+                if pending:
+                    # Query the API for current progress and update rows accordingly.
+                    if len(pending) != last_pending_count:
+                        last_pending_count = len(pending)
+                        self.polling_status.emit(f"正在解析，剩余 {last_pending_count} / {total_files} 个文件…")
+                    payload = self._api_client.fetch_batch_status(self._task.batch_id)
+                    extract_result = payload.get("data", {}).get("extract_result", [])
+                    signature = _progress_signature(extract_result)
+                    poll_interval = _next_poll_interval(
+                        poll_interval, signature != last_signature, self.POLL_INTERVAL_MIN, self.POLL_INTERVAL_MAX
+                    )
+                    last_signature = signature
+                    # Visit only files still pending; the snapshot keeps pops inside the loop safe.
+                    by_name = {item.get("file_name"): item for item in extract_result}
+                    for name in list(pending):
+                        item = by_name.get(name)
+                        if item is None:
+                            continue
+                        ready = self._apply_extract_item(item, pending)
+                        if ready is not None:
+                            file_item, zip_url = ready
+                            in_flight[pool.submit(self._download_and_store, file_item, zip_url)] = file_item
+                else:
+                    # Nothing left to poll; wait for the remaining downloads but stay cancellable.
+                    self._wait_first(in_flight)
+
+                running: Dict[Future, UploadFile] = {}
+                for future, file_item in in_flight.items():
+                    if not future.done():
+                        running[future] = file_item
+                    elif file_item.status == TaskStatus.COMPLETED:
+                        completed += 1
+                in_flight = running
+                overall = 40 + (completed * 60) // total_files
+                self._emit_progress(overall)
+                if pending:
+                    self._cancel_event.wait(poll_interval)
+
+            if self._is_cancelled:
+                # Downloads that have not started yet are dropped; running ones finish.
+                for future, file_item in in_flight.items():
+                    if future.cancel():
+                        pending[file_item.display_name] = file_item
+
+        if self._is_cancelled:
+            for file_item in pending.values():
+                file_item.status = TaskStatus.CANCELLED
+                file_item.progress_label = "已取消"
+                self._emit_file_update(file_item)
+            self.polling_status.emit("任务已取消")
+            raise RuntimeError("任务被取消")
+
+        self._task.mark_completed()
+        self._emit_progress(100)
+        self.polling_status.emit("解析任务完成")
+        self.batch_completed.emit(self._task)
+
+    def _apply_extract_item(self, item: dict, pending: Dict[str, UploadFile]) -> Optional[tuple]:
+        """Apply one extract_result entry to its pending file, dropping it once terminal.
+
+        Returns ``(file_item, zip_url)`` when the file finished and its result should be fetched.
+        """
+        name = item.get("file_name")
+        file_item = pending.get(name)
+        if file_item is None:
+            return None
+
+        ready = None
+        state = (item.get("state") or "").lower()
+        if state == "done":
+            pending.pop(name, None)
+            zip_url = item.get("full_zip_url")
+            if zip_url:
+                file_item.progress_label = "下载结果中"
+                ready = (file_item, zip_url)
+            else:
+                file_item.status = TaskStatus.FAILED
+                file_item.error = "结果链接缺失"
+                file_item.progress_label = "结果处理失败"
+                self.log_generated.emit(f"{name} 下载或解压失败：结果链接缺失")
+        elif state in self.STATES_FAILED:
+            pending.pop(name, None)
+            file_item.status = TaskStatus.FAILED
+            file_item.error = item.get("err_msg") or item.get("message") or "解析失败"
+            file_item.progress_label = "解析失败"
+            self.log_generated.emit(f"{name} 解析失败：{file_item.error}")
+        elif state in self.STATES_WAITING:
+            file_item.progress_label = "等待解析"
+        elif state in self.STATES_RUNNING:
+            progress_info = item.get("extract_progress") or {}
+            extracted = progress_info.get("extracted_pages")
+            total_pages = progress_info.get("total_pages")
+            if extracted is not None and total_pages:
+                file_item.progress_label = f"解析中 ({extracted}/{total_pages})"
+            else:
+                file_item.progress_label = "解析中"
+        elif state == "converting":
+            file_item.progress_label = "转换中"
+        self._emit_file_update(file_item)
+        return ready
+
+    def _download_and_store(
+        self,
+        file_item: UploadFile,
+        zip_url: str,
+        done_label: str = "解析完成",
+        done_log: str = "{name} 解析完成，结果已保存至 {target_dir}",
+    ) -> None:
+        """Fetch and extract one finished result; runs on the download pool."""
+        name = file_item.display_name
+        try:
+            with self._api_client.download_result(zip_url) as package:
+                target_dir = _store_result_package(
+                    self._task,
+                    self._output_dir,
+                    file_item,
+                    package,
+                    self.log_generated.emit,
+                )
+            file_item.status = TaskStatus.COMPLETED
+            file_item.progress_label = done_label
+            file_item.error = None
+            self.log_generated.emit(done_log.format(name=name, target_dir=target_dir))
+        except Exception as exc:  # pylint: disable=broad-except
+            file_item.status = TaskStatus.FAILED
+            file_item.error = str(exc)
+            file_item.progress_label = "结果处理失败"
+            self.log_generated.emit(f"{name} 下载或解压失败：{exc}")
+        self._emit_file_update(file_item)
+
+
+class BatchWorker(QThread, _PollingMixin):
     """Execute full lifecycle of a batch task in a background thread."""
 
     progress_updated = Signal(int)
@@ -78,8 +318,6 @@ class BatchWorker(QThread):
     batch_prepared = Signal(BatchTask)
     batch_ready = Signal(BatchTask)
 
-    POLL_INTERVAL = 2.0
-
     def __init__(
         self,
         task: BatchTask,
@@ -97,11 +335,13 @@ class BatchWorker(QThread):
         self._output_dir = output_dir
         self._auto_retry = auto_retry
         self._max_retry = max_retry
-        self._is_cancelled = False
+        self._cancel_event = threading.Event()
+        self._last_emitted: Dict[str, tuple] = {}
+        self._last_progress = -1
 
     def cancel(self) -> None:
-        """Request cancellation; the running loop checks this flag periodically."""
-        self._is_cancelled = True
+        """Request cancellation; waits in the worker wake up immediately."""
+        self._cancel_event.set()
 
     def run(self) -> None:
         """Entry point executed by QThread.start that delegates to the worker loop."""
@@ -114,7 +354,7 @@ class BatchWorker(QThread):
     def _run_internal(self) -> None:
         """Upload all files and then poll the API until completion or failure."""
         logger.info("Starting batch with %d files", len(self._task.files))
-        self.progress_updated.emit(0)
+        self._emit_progress(0)
 
         batch_meta = self._api_client.create_batch(self._task.files, self._options)
         self._task.batch_id = batch_meta.batch_id
@@ -128,37 +368,71 @@ class BatchWorker(QThread):
         url_map = dict(zip([f.display_name for f in self._task.files], batch_meta.file_urls))
         total_files = len(self._task.files) or 1
 
-        for index, file_item in enumerate(self._task.files, start=1):
-            if self._is_cancelled:
-                self.log_generated.emit("任务被用户取消。")
+        # Uploads are independent PUTs that spend their time in socket I/O, so run them in parallel.
+        max_workers = max(1, min(self._options.concurrency, len(self._task.files)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mineru-upload") as executor:
+            futures = {
+                executor.submit(self._upload_file_item, file_item, url_map): file_item
+                for file_item in self._task.files
+            }
+            uploaded: List[UploadFile] = []
+            remaining = set(futures)
+            finished = 0
+            while remaining:
+                if self._is_cancelled:
+                    # Uploads that have not started are dropped; running ones stop at their next check.
+                    for future in remaining:
+                        if future.cancel():
+                            self._update_file_status(futures[future], TaskStatus.CANCELLED)
+                    done, remaining = wait(remaining)
+                else:
+                    done = self._wait_first(remaining)
+                    remaining -= done
+                for future in done:
+                    finished += 1
+                    if not future.cancelled() and future.result():
+                        uploaded.append(futures[future])
+                self._emit_progress(int((finished / total_files) * 40))
+
+        self._emit_progress(40)
+
+        if self._is_cancelled:
+            for file_item in uploaded:
                 self._update_file_status(file_item, TaskStatus.CANCELLED)
-                continue
+            raise RuntimeError("任务被取消")
+        if not uploaded:
+            raise RuntimeError("所有文件上传失败，批处理终止。")
 
-            try:
-                file_item.status = TaskStatus.UPLOADING
-                file_item.progress_label = "上传中"
-                self._emit_file_update(file_item)
-                signed_url = url_map[file_item.display_name]
-                self._upload_with_retry(file_item, signed_url)
-                file_item.status = TaskStatus.PROCESSING
-                file_item.progress_label = "等待解析"
-                self._emit_file_update(file_item)
-                self.progress_updated.emit(int((index / total_files) * 40))
-            except Exception as exc:  # pylint: disable=broad-except
-                file_item.status = TaskStatus.FAILED
-                file_item.error = str(exc)
-                file_item.progress_label = "上传失败"
-                self._emit_file_update(file_item)
-                self.log_generated.emit(f"{file_item.display_name} 上传失败：{exc}")
+        self.batch_ready.emit(self._task)
+        self._poll_until_complete(uploaded)
 
-        has_processing = any(file.status == TaskStatus.PROCESSING for file in self._task.files)
-        self.progress_updated.emit(40)
+    def _upload_file_item(self, file_item: UploadFile, url_map: Dict[str, str]) -> bool:
+        """Upload one file and record the outcome on it; runs on the upload pool.
 
-        if not has_processing:
-            raise RuntimeError("所有文件上传失败，批处理终止。")
+        Returns True when the file was uploaded and is now waiting to be parsed.
+        """
+        if self._is_cancelled:
+            self.log_generated.emit("任务被用户取消。")
+            self._update_file_status(file_item, TaskStatus.CANCELLED)
+            return False
 
-        self.batch_ready.emit(self._task)
-        self._poll_until_complete()
+        try:
+            file_item.status = TaskStatus.UPLOADING
+            file_item.progress_label = "上传中"
+            self._emit_file_update(file_item)
+            signed_url = url_map[file_item.display_name]
+            self._upload_with_retry(file_item, signed_url)
+            file_item.status = TaskStatus.PROCESSING
+            file_item.progress_label = "等待解析"
+            self._emit_file_update(file_item)
+            return True
+        except Exception as exc:  # pylint: disable=broad-except
+            file_item.status = TaskStatus.FAILED
+            file_item.error = str(exc)
+            file_item.progress_label = "上传失败"
+            self._emit_file_update(file_item)
+            self.log_generated.emit(f"{file_item.display_name} 上传失败：{exc}")
+            return False
 
     def _upload_with_retry(self, file_item: UploadFile, signed_url: str) -> None:
         """Upload a single file, retrying when configured until success or failure."""
@@ -170,7 +444,7 @@ class BatchWorker(QThread):
                 file_item.attempts += 1
                 file_item.progress_label = f"上传中 (第{file_item.attempts}次)"
                 self._emit_file_update(file_item)
-                self._api_client.upload_file(signed_url, Path(file_item.path))
+                self._api_client.upload_file(signed_url, file_item.path)
                 self.log_generated.emit(f"{file_item.display_name} 上传完成。")
                 return
             except Exception as exc:  # pylint: disable=broad-except
@@ -183,101 +457,14 @@ class BatchWorker(QThread):
                 )
                 if not self._auto_retry or attempts > self._max_retry:
                     raise
-                time.sleep(1.5 * attempts)
-
-    def _poll_until_complete(self) -> None:
-        """Continuously poll the batch status endpoint and handle file state transitions."""
-        pending = {
-            file.display_name: file
-            for file in self._task.files
-            if file.status == TaskStatus.PROCESSING
-        }
-        total_files = len(self._task.files) or 1
+                self._cancel_event.wait(1.5 * attempts)
+
+    def _poll_until_complete(self, uploaded: List[UploadFile]) -> None:
+        """Hand every successfully uploaded file to the shared polling loop."""
+        pending = {file_item.display_name: file_item for file_item in uploaded}
         if pending:
             self.polling_status.emit(f"文件上传完成，等待解析（共 {len(pending)} 个文件）…")
-        while pending and not self._is_cancelled:
-            # Query the API for current progress and update rows accordingly.
-            self.polling_status.emit(f"正在解析，剩余 {len(pending)} / {total_files} 个文件…")
-            payload = self._api_client.fetch_batch_status(self._task.batch_id)
-            extract_result = payload.get("data", {}).get("extract_result", [])
-            for item in extract_result:
-                name = item.get("file_name")
-                if name not in pending:
-                    continue
-
-                state = (item.get("state") or "").lower()
-                file_item = pending[name]
-
-                if state == "done":
-                    zip_url = item.get("full_zip_url")
-                    try:
-                        if not zip_url:
-                            raise RuntimeError("结果链接缺失")
-                        package_bytes = self._api_client.download_result(zip_url)
-                        target_dir = _store_result_package(
-                            self._task,
-                            self._output_dir,
-                            file_item,
-                            package_bytes,
-                            self.log_generated.emit,
-                        )
-                        file_item.status = TaskStatus.COMPLETED
-                        file_item.progress_label = "解析完成"
-                        file_item.error = None
-                        self._emit_file_update(file_item)
-                        self.log_generated.emit(f"{name} 解析完成，结果已保存至 {target_dir}")
-                        pending.pop(name, None)
-                    except Exception as exc:  # pylint: disable=broad-except
-                        file_item.status = TaskStatus.FAILED
-                        file_item.error = str(exc)
-                        file_item.progress_label = "结果处理失败"
-                        self._emit_file_update(file_item)
-                        pending.pop(name, None)
-                        self.log_generated.emit(f"{name} 下载或解压失败：{exc}")
-                elif state in {"failed", "error"}:
-                    file_item.status = TaskStatus.FAILED
-                    file_item.error = item.get("message", "解析失败")
-                    file_item.progress_label = "解析失败"
-                    self._emit_file_update(file_item)
-                    pending.pop(name, None)
-                    self.log_generated.emit(f"{name} 解析失败：{file_item.error}")
-                elif state in {"pending", "queued"}:
-                    file_item.progress_label = "等待解析"
-                    self._emit_file_update(file_item)
-                elif state in {"running", "processing"}:
-                    progress_info = item.get("extract_progress", {}) or {}
-                    extracted = progress_info.get("extracted_pages")
-                    total_pages = progress_info.get("total_pages")
-                    if extracted is not None and total_pages:
-                        file_item.progress_label = f"解析中 ({extracted}/{total_pages})"
-                    else:
-                        file_item.progress_label = "解析中"
-                    self._emit_file_update(file_item)
-                elif state == "converting":
-                    file_item.progress_label = "转换中"
-                    self._emit_file_update(file_item)
-
-            completed = len([f for f in self._task.files if f.status == TaskStatus.COMPLETED])
-            overall = 40 + int((completed / total_files) * 60)
-            self.progress_updated.emit(min(100, overall))
-            time.sleep(self.POLL_INTERVAL)
-
-        if self._is_cancelled:
-            for file in pending.values():
-                file.status = TaskStatus.CANCELLED
-                file.progress_label = "已取消"
-                self._emit_file_update(file)
-            self.polling_status.emit("任务已取消")
-            raise RuntimeError("任务被取消")
-
-        self._task.mark_completed()
-        self.progress_updated.emit(100)
-        self.polling_status.emit("解析任务完成")
-        self.batch_completed.emit(self._task)
-
-    def _emit_file_update(self, file_item: UploadFile) -> None:
-        """Emit a unified signal whenever a file's state changes."""
-        self.file_updated.emit(file_item.display_name, file_item)
+        self._poll_pending(pending)
 
     def _update_file_status(self, file_item: UploadFile, status: TaskStatus) -> None:
         """Helper to update a file's status while keeping UI state consistent."""
@@ -287,7 +474,7 @@ class BatchWorker(QThread):
         self._emit_file_update(file_item)
 
 
-class ResultRecoveryWorker(QThread):
+class ResultRecoveryWorker(QThread, _PollingMixin):
     """Worker dedicated to resuming polling or redownloading results for existing batches."""
 
     progress_updated = Signal(int)
@@ -297,8 +484,6 @@ class ResultRecoveryWorker(QThread):
     log_generated = Signal(str)
     polling_status = Signal(str)
 
-    POLL_INTERVAL = 2.0
-
     def __init__(
         self,
         task: BatchTask,
@@ -312,12 +497,14 @@ class ResultRecoveryWorker(QThread):
         self._api_client = api_client
         self._output_dir = output_dir
         self._mode = mode
-        self._is_cancelled = False
+        self._cancel_event = threading.Event()
+        self._last_emitted: Dict[str, tuple] = {}
+        self._last_progress = -1
         self._task.output_dir = output_dir
 
     def cancel(self) -> None:
         """Signal that the recovery workflow should abort at the next opportunity."""
-        self._is_cancelled = True
+        self._cancel_event.set()
 
     def run(self) -> None:
         """Execute either the polling resume path or the ZIP re-download routine."""
@@ -330,13 +517,9 @@ class ResultRecoveryWorker(QThread):
             logger.exception("Result recovery failed: %s", exc)
             self.batch_failed.emit(self._task, str(exc))
 
-    def _emit_file_update(self, file_item: UploadFile) -> None:
-        """Forward file state changes to the UI."""
-        self.file_updated.emit(file_item.display_name, file_item)
-
     def _resume_polling(self) -> None:
         """Recreate the polling loop for an already uploaded batch."""
-        self.progress_updated.emit(40)
+        self._emit_progress(40)
         pending: Dict[str, UploadFile] = {}
         total_files = len(self._task.files) or 1
 
@@ -355,97 +538,21 @@ class ResultRecoveryWorker(QThread):
         else:
             self.polling_status.emit("检查批次状态…")
 
-        while pending and not self._is_cancelled:
-            # Poll repeatedly until every outstanding file reaches a terminal state.
-            self.polling_status.emit(f"正在解析，剩余 {len(pending)} / {total_files} 个文件…")
-            payload = self._api_client.fetch_batch_status(self._task.batch_id)
-            extract_result = payload.get("data", {}).get("extract_result", [])
-            for item in extract_result:
-                name = item.get("file_name")
-                if name not in pending:
-                    continue
-
-                state = (item.get("state") or "").lower()
-                file_item = pending[name]
-
-                if state == "done":
-                    zip_url = item.get("full_zip_url")
-                    try:
-                        if not zip_url:
-                            raise RuntimeError("结果链接缺失")
-                        package_bytes = self._api_client.download_result(zip_url)
-                        target_dir = _store_result_package(
-                            self._task,
-                            self._output_dir,
-                            file_item,
-                            package_bytes,
-                            self.log_generated.emit,
-                        )
-                        file_item.status = TaskStatus.COMPLETED
-                        file_item.progress_label = "解析完成"
-                        file_item.error = None
-                        self._emit_file_update(file_item)
-                        self.log_generated.emit(f"{name} 解析完成，结果已保存至 {target_dir}")
-                        pending.pop(name, None)
-                    except Exception as exc:  # pylint: disable=broad-except
-                        file_item.status = TaskStatus.FAILED
-                        file_item.error = str(exc)
-                        file_item.progress_label = "结果处理失败"
-                        self._emit_file_update(file_item)
-                        pending.pop(name, None)
-                        self.log_generated.emit(f"{name} 下载或解压失败：{exc}")
-                elif state in {"failed", "error"}:
-                    file_item.status = TaskStatus.FAILED
-                    file_item.error = item.get("message", "解析失败")
-                    file_item.progress_label = "解析失败"
-                    self._emit_file_update(file_item)
-                    pending.pop(name, None)
-                    self.log_generated.emit(f"{name} 解析失败：{file_item.error}")
-                elif state in {"pending", "queued"}:
-                    file_item.progress_label = "等待解析"
-                    self._emit_file_update(file_item)
-                elif state in {"running", "processing"}:
-                    progress_info = item.get("extract_progress", {}) or {}
-                    extracted = progress_info.get("extracted_pages")
-                    total_pages = progress_info.get("total_pages")
-                    if extracted is not None and total_pages:
-                        file_item.progress_label = f"解析中 ({extracted}/{total_pages})"
-                    else:
-                        file_item.progress_label = "解析中"
-                    self._emit_file_update(file_item)
-                elif state == "converting":
-                    file_item.progress_label = "转换中"
-                    self._emit_file_update(file_item)
-
-            completed = len([f for f in self._task.files if f.status == TaskStatus.COMPLETED])
-            overall = 40 + int((completed / total_files) * 60)
-            self.progress_updated.emit(min(100, overall))
-            time.sleep(self.POLL_INTERVAL)
-
-        if self._is_cancelled:
-            for file in pending.values():
-                file.status = TaskStatus.CANCELLED
-                file.progress_label = "已取消"
-                self._emit_file_update(file)
-            self.polling_status.emit("任务已取消")
-            raise RuntimeError("任务被取消")
-
-        self._task.mark_completed()
-        self.progress_updated.emit(100)
-        self.polling_status.emit("解析任务完成")
-        self.batch_completed.emit(self._task)
+        self._poll_pending(pending)
 
     def _redownload_results(self) -> None:
         """Download finished results again without re-uploading files."""
-        self.progress_updated.emit(0)
+        self._emit_progress(0)
         payload = self._api_client.fetch_batch_status(self._task.batch_id)
         extract_result = payload.get("data", {}).get("extract_result", [])
         if not extract_result:
             raise RuntimeError("未获取到批次状态信息。")
 
+        # Validate the whole batch before fetching anything, then download in parallel.
         total_items = len(extract_result)
+        downloads: List[tuple] = []
+        finished = 0
         for index, item in enumerate(extract_result, start=1):
-            # Iterate over each file and rebuild the on-disk structure if finished.
             name = item.get("file_name") or f"文件{index}"
             state = (item.get("state") or "").lower()
             file_item = self._ensure_file_item(name)
@@ -454,28 +561,44 @@ class ResultRecoveryWorker(QThread):
                 zip_url = item.get("full_zip_url")
                 if not zip_url:
                     raise RuntimeError(f"{name} 的结果链接缺失")
-                package_bytes = self._api_client.download_result(zip_url)
-                target_dir = _store_result_package(
-                    self._task,
-                    self._output_dir,
-                    file_item,
-                    package_bytes,
-                    self.log_generated.emit,
-                )
-                file_item.status = TaskStatus.COMPLETED
-                file_item.error = None
-                file_item.progress_label = "重新下载完成"
-                self.log_generated.emit(f"{name} 结果已重新下载至 {target_dir}")
-            elif state in {"failed", "error"}:
+                downloads.append((file_item, zip_url))
+            elif state in self.STATES_FAILED:
                 file_item.status = TaskStatus.FAILED
-                file_item.error = item.get("message", "解析失败")
+                file_item.error = item.get("err_msg") or item.get("message") or "解析失败"
                 file_item.progress_label = "解析失败"
                 self.log_generated.emit(f"{name} 解析失败：{file_item.error}")
+                self._emit_file_update(file_item)
+                finished += 1
             else:
                 raise RuntimeError("批次仍在解析中，请先重新开始轮询。")
 
-            self._emit_file_update(file_item)
-            self.progress_updated.emit(int((index / total_items) * 100))
+        if finished:
+            self._emit_progress(int((finished / total_items) * 100))
+        with ThreadPoolExecutor(max_workers=self.DOWNLOAD_WORKERS, thread_name_prefix="mineru-download") as pool:
+            futures = [
+                pool.submit(
+                    self._download_and_store,
+                    file_item,
+                    zip_url,
+                    done_label="重新下载完成",
+                    done_log="{name} 结果已重新下载至 {target_dir}",
+                )
+                for file_item, zip_url in downloads
+            ]
+            for _future in as_completed(futures):
+                finished += 1
+                self._emit_progress(int((finished / total_items) * 100))
+
+        # _download_and_store records failures on the file instead of raising; report them here.
+        failed = [file_item.display_name for file_item, _url in downloads if file_item.status == TaskStatus.FAILED]
+        if failed:
+            if len(failed) == len(downloads):
+                message = f"全部 {len(failed)} 个结果重新下载失败：{'、'.join(failed)}"
+            else:
+                message = f"{len(failed)} / {len(downloads)} 个结果重新下载失败：{'、'.join(failed)}"
+            self.polling_status.emit("结果重新下载失败")
+            self.batch_failed.emit(self._task, message)
+            return
 
         self._task.mark_completed()
         self.polling_status.emit("结果重新下载完成")
@@ -503,17 +626,34 @@ class TaskManager(QObject):
     log_generated = Signal(str)
     polling_status = Signal(str)
 
-    HISTORY_FILE = Path(".mineru_history.json")
+    HISTORY_FILE = Path(".mineru_history.jsonl")
+    LEGACY_HISTORY_FILE = Path(".mineru_history.json")
+    # Rewrite the append-only log once it holds this many lines per retained entry.
+    HISTORY_COMPACT_FACTOR = 4
+    # Bursts of history updates within this window are written and broadcast once.
+    HISTORY_FLUSH_DELAY_MS = 250
 
     def __init__(self, api_client: MinerUApiClient, config: AppConfig) -> None:
         """Initialise the manager with the API client and persisted configuration."""
         super().__init__()
         self._api_client = api_client
         self._config = config
-        self._history = self._load_history()
+        self._history_log_lines = 0
+        # batch id -> (entry the paths were parsed from, [(Path, display name)])
+        self._history_paths: Dict[str, tuple] = {}
+        # Keyed by batch id in creation order (oldest first); the log on disk is replayed into it.
+        self._history_by_id: Dict[str, dict] = self._load_history()
+        self._dirty_history_ids: set[str] = set()
+        self._history_flush_timer = QTimer(self)
+        self._history_flush_timer.setSingleShot(True)
+        self._history_flush_timer.setInterval(self.HISTORY_FLUSH_DELAY_MS)
+        self._history_flush_timer.timeout.connect(self.flush_history)
+        # One writer thread keeps appends ordered while keeping disk I/O off the GUI thread.
+        self._history_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mineru-history")
+        self._history_write: Optional[Future] = None
         self._active_worker: Optional[QThread] = None
 
-    def start_batch(self, file_paths: Iterable[Path], output_dir: Path | str) -> None:
+    def start_batch(self, file_paths: Iterable[Path | str], output_dir: Path | str) -> None:
         """Kick off a brand new batch upload for the selected files."""
         self._ensure_idle()
 
@@ -521,10 +661,10 @@ class TaskManager(QObject):
         if not destination.exists() or not destination.is_dir():
             raise FileNotFoundError(f"输出目录不存在：{destination}")
 
-        files = [
-            UploadFile(path=Path(path), display_name=Path(path).name)
-            for path in file_paths
-        ]
+        files = []
+        for path in file_paths:
+            path = Path(path)
+            files.append(UploadFile(path=path, display_name=path.name))
         task = BatchTask(batch_id=None, files=files, output_dir=destination)
 
         worker = BatchWorker(
@@ -646,9 +786,27 @@ class TaskManager(QObject):
         """Return True when either worker is currently running."""
         return bool(self._active_worker and self._active_worker.isRunning())
 
+    def flush_history(self, wait: bool = False) -> None:
+        """Queue pending history changes for writing and notify listeners once.
+
+        With ``wait`` the call blocks until every queued write has reached the file.
+        """
+        self._history_flush_timer.stop()
+        if self._dirty_history_ids:
+            dirty, self._dirty_history_ids = self._dirty_history_ids, set()
+            # Walk the index rather than the set so new batches hit the log in creation order.
+            self._append_history([entry for batch_id, entry in self._history_by_id.items() if batch_id in dirty])
+            self._emit_history_update()
+        if wait and self._history_write is not None:
+            self._history_write.result()
+
     def get_history(self) -> List[dict]:
-        """Provide a defensive copy of history for UI consumption."""
-        return copy.deepcopy(self._history)
+        """Provide history newest-first without copying.
+
+        Entries are replaced rather than mutated once stored (``files`` is a tuple), so
+        the returned dictionaries are stable snapshots; callers must treat them as read-only.
+        """
+        return list(reversed(self._history_by_id.values()))
 
     def _ensure_idle(self) -> None:
         """Validate that no worker is active before starting a new one."""
@@ -658,8 +816,8 @@ class TaskManager(QObject):
     def _handle_batch_prepared(self, task: BatchTask) -> None:
         """Persist early batch metadata as soon as upload URLs are ready."""
         files = [
-            {"path": str(file.path), "display_name": file.display_name}
-            for file in task.files
+            {"path": str(file_item.path), "display_name": file_item.display_name}
+            for file_item in task.files
         ]
         self._update_history_entry(
             task.batch_id,
@@ -684,15 +842,17 @@ class TaskManager(QObject):
         """Finalise history when a batch successfully finishes."""
         logger.info("Batch %s completed", task.batch_id)
         completed_at = (task.completed_at or datetime.utcnow()).isoformat()
+        counts = task.status_counts()
         self._update_history_entry(
             task.batch_id,
             status=HistoryStatus.COMPLETED.value,
-            success=task.success_count(),
-            failed=task.failure_count(),
+            success=counts[TaskStatus.COMPLETED],
+            failed=counts[TaskStatus.FAILED],
             completed_at=completed_at,
             timestamp=completed_at,
             last_error=None,
         )
+        self.flush_history()
         self.batch_completed.emit(task)
         self._active_worker = None
 
@@ -707,31 +867,55 @@ class TaskManager(QObject):
                 last_error=message,
                 timestamp=timestamp,
             )
+            self.flush_history()
         self.batch_failed.emit(task, message)
         self._active_worker = None
 
-    def _load_history(self) -> List[dict]:
-        """Read the history JSON file from disk, normalising legacy structures."""
-        if not self.HISTORY_FILE.exists():
-            return []
+    def _load_history(self) -> Dict[str, dict]:
+        """Replay the history log into an id index, migrating the legacy JSON file once."""
+        entries: Dict[str, dict] = {}
+        if self.HISTORY_FILE.exists():
+            with self.HISTORY_FILE.open("rb") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    self._history_log_lines += 1
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # Most likely a torn final line from an interrupted append.
+                        logger.warning("Skipping corrupted history line.")
+                        continue
+                    if isinstance(record, dict) and record.get("batch_id"):
+                        # Later lines replace earlier ones but keep the original position.
+                        entries[record["batch_id"]] = self._normalize_history_entry(record)
+            self._trim_history(entries)
+            return entries
+
+        if not self.LEGACY_HISTORY_FILE.exists():
+            return entries
         try:
-            raw = json.loads(self.HISTORY_FILE.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            raw = orjson.loads(self.LEGACY_HISTORY_FILE.read_bytes())
+        except orjson.JSONDecodeError:
             logger.warning("History file is corrupted, starting fresh.")
-            return []
-
-        normalized = []
-        for entry in raw:
-            if not isinstance(entry, dict):
-                continue
-            normalized.append(self._normalize_history_entry(entry))
-        return normalized[: self._config.history_limit]
+            return entries
+        if not isinstance(raw, list):
+            return entries
+
+        # The legacy file stores newest first.
+        for entry in reversed(raw[: self._config.history_limit]):
+            if isinstance(entry, dict) and entry.get("batch_id"):
+                entries[entry["batch_id"]] = self._normalize_history_entry(entry)
+        self._compact_history(list(entries.values()))
+        self._history_log_lines = len(entries)
+        return entries
 
     def _normalize_history_entry(self, entry: Dict) -> Dict:
         """Set default values and ensure history entries use the latest schema."""
-        files: List[Dict[str, str]] = []
-        for item in entry.get("files", []):
-            if isinstance(item, dict):
+        get = entry.get
+        files = []
+        for item in get("files") or ():
+            if type(item) is dict:
                 path_text = item.get("path") or ""
                 display = item.get("display_name") or Path(path_text).name
             else:
@@ -739,43 +923,74 @@ class TaskManager(QObject):
                 display = Path(path_text).name
             files.append({"path": path_text, "display_name": display})
 
-        created = entry.get("created_at") or entry.get("timestamp") or ""
-        completed = entry.get("completed_at") or None
-        status = entry.get("status")
-        if not status:
-            status = HistoryStatus.COMPLETED.value if completed else HistoryStatus.UNKNOWN.value
-
-        normalized = {
-            "batch_id": entry.get("batch_id"),
+        timestamp = get("timestamp")
+        created = get("created_at") or timestamp or ""
+        completed = get("completed_at") or None
+        return {
+            "batch_id": get("batch_id"),
             "created_at": created,
             "completed_at": completed,
-            "timestamp": entry.get("timestamp") or completed or created,
-            "status": status,
-            "success": entry.get("success", 0),
-            "failed": entry.get("failed", 0),
-            "output_dir": entry.get("output_dir", ""),
-            "files": files,
-            "last_error": entry.get("last_error"),
+            "timestamp": timestamp or completed or created,
+            "status": get("status") or (_HISTORY_COMPLETED if completed else _HISTORY_UNKNOWN),
+            "success": get("success", 0),
+            "failed": get("failed", 0),
+            "output_dir": get("output_dir", ""),
+            "files": tuple(files),
+            "last_error": get("last_error"),
         }
-        return normalized
-
-    def _save_history(self) -> None:
-        """Persist the current history list to disk."""
-        serialized = copy.deepcopy(self._history)
-        self.HISTORY_FILE.write_text(
-            json.dumps(serialized, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+
+    def _trim_history(self, entries: Dict[str, dict]) -> None:
+        """Drop the oldest entries beyond the configured history limit, with their cached paths."""
+        while len(entries) > self._config.history_limit:
+            batch_id = next(iter(entries))
+            del entries[batch_id]
+            self._history_paths.pop(batch_id, None)
+
+    def _append_history(self, entries: List[dict]) -> None:
+        """Hand entry snapshots to the history writer, compacting the log when it grows too long."""
+        if not entries:
+            return
+        self._history_log_lines += len(entries)
+        if self._history_log_lines > self.HISTORY_COMPACT_FACTOR * self._config.history_limit:
+            # The compacted log already contains the entries being appended.
+            retained = list(self._history_by_id.values())
+            self._history_log_lines = len(retained)
+            for batch_id in self._history_paths.keys() - self._history_by_id.keys():
+                del self._history_paths[batch_id]
+            self._history_write = self._history_writer.submit(self._compact_history, retained)
+        else:
+            self._history_write = self._history_writer.submit(self._write_history_lines, entries)
+
+    def _write_history_lines(self, entries: List[dict]) -> None:
+        """Append entries to the log, syncing to disk when any reached a terminal state."""
+        lines = b"".join(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in entries)
+        terminal = (HistoryStatus.COMPLETED.value, HistoryStatus.FAILED.value)
+        try:
+            with self.HISTORY_FILE.open("ab") as handle:
+                handle.write(lines)
+                if any(entry.get("status") in terminal for entry in entries):
+                    handle.flush()
+                    os.fsync(handle.fileno())
+        except OSError:
+            logger.exception("Failed to append to history file %s", self.HISTORY_FILE)
+
+    def _compact_history(self, entries: List[dict]) -> None:
+        """Atomically rewrite the log with a single line per retained entry."""
+        lines = b"".join(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in entries)
+        try:
+            write_bytes_atomic(self.HISTORY_FILE, lines)
+        except OSError:
+            logger.exception("Failed to compact history file %s", self.HISTORY_FILE)
 
     def _emit_history_update(self) -> None:
-        """Notify listeners whenever history changes."""
-        self.history_updated.emit(copy.deepcopy(self._history))
+        """Notify listeners whenever history changes, sharing the read-only entry snapshots."""
+        self.history_updated.emit(self.get_history())
 
     def _update_history_entry(self, batch_id: Optional[str], **updates) -> Optional[dict]:
-        """Upsert a history entry with the provided fields and keep the list trimmed."""
+        """Upsert a history entry in memory and schedule a debounced flush to disk."""
         if not batch_id:
             return None
-        entry = self._find_history_entry(batch_id)
+        previous = entry = self._find_history_entry(batch_id)
         if entry is None:
             entry = {
                 "batch_id": batch_id,
@@ -786,39 +1001,45 @@ class TaskManager(QObject):
                 "success": updates.get("success", 0),
                 "failed": updates.get("failed", 0),
                 "output_dir": updates.get("output_dir", ""),
-                "files": updates.get("files", []),
+                "files": tuple(updates.get("files") or ()),
                 "last_error": updates.get("last_error"),
             }
             if not entry.get("timestamp"):
                 entry["timestamp"] = entry["completed_at"] or entry["created_at"]
-            self._history.insert(0, entry)
         else:
+            # Copy on write: entries already handed out by get_history are never mutated.
+            entry = dict(entry)
             for key, value in updates.items():
                 if key == "files":
-                    entry[key] = value or []
+                    entry[key] = tuple(value or ())
                 elif value is not None:
                     entry[key] = value
 
         entry["timestamp"] = entry.get("timestamp") or entry.get("completed_at") or entry.get("created_at")
-        self._history = self._history[: self._config.history_limit]
-        self._save_history()
-        self._emit_history_update()
+        if entry == previous:
+            # Nothing serialised would change; skip the write and the UI refresh.
+            return previous
+        self._history_by_id[batch_id] = entry
+        self._trim_history(self._history_by_id)
+        self._dirty_history_ids.add(batch_id)
+        if not self._history_flush_timer.isActive():
+            self._history_flush_timer.start()
         return entry
 
     def _find_history_entry(self, batch_id: str) -> Optional[dict]:
         """Return the history entry for a given batch id, or None when missing."""
-        for entry in self._history:
-            if entry.get("batch_id") == batch_id:
-                return entry
-        return None
+        return self._history_by_id.get(batch_id)
 
     def _files_from_history(self, entry: Dict) -> List[UploadFile]:
         """Reconstruct UploadFile objects from persisted history metadata."""
-        files: List[UploadFile] = []
-        for info in entry.get("files", []):
-            path_text = info.get("path") if isinstance(info, dict) else str(info)
-            display = info.get("display_name") if isinstance(info, dict) else Path(path_text).name
-            path_value = Path(path_text) if path_text else Path(display)
-            upload = UploadFile(path=path_value, display_name=display)
-            files.append(upload)
-        return files
+        # Entries are normalised and replaced on update, so parsed paths stay valid per entry object.
+        batch_id = entry.get("batch_id")
+        cached = self._history_paths.get(batch_id)
+        if cached is None or cached[0] is not entry:
+            parsed = [
+                (Path(info["path"] or info["display_name"]), info["display_name"])
+                for info in entry.get("files", ())
+            ]
+            cached = (entry, parsed)
+            self._history_paths[batch_id] = cached
+        return [UploadFile(path=path, display_name=display) for path, display in cached[1]]
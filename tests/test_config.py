@@ -1,6 +1,7 @@
 """Unit tests covering the configuration persistence helpers."""
 
 import json
+import os
 from pathlib import Path
 
 from core.config import AppConfig, AppOptions, ConfigManager
@@ -39,6 +40,17 @@ def test_config_loads_defaults_when_missing(tmp_path):
     assert config.options.enable_table
 
 
+def test_config_loads_defaults_for_non_object_json(tmp_path):
+    """Fall back to defaults when config.json holds null or another non-object value."""
+    config_path = tmp_path / "config.json"
+    manager = ConfigManager(config_path=config_path, key_path=tmp_path / "key.key")
+    for raw in ("null", "[]", "3"):
+        config_path.write_text(raw, encoding="utf-8")
+        config = manager.load()
+        assert config.api_key == ""
+        assert config.options == AppOptions()
+
+
 def test_config_loads_plaintext_backward_compatibility(tmp_path):
     """Ensure legacy plaintext configs can still be read successfully."""
     config_path = tmp_path / "config.json"
@@ -51,3 +63,46 @@ def test_config_loads_plaintext_backward_compatibility(tmp_path):
     config = manager.load()
     assert config.api_key == "plain-text-key"
     assert config.output_dir == "/data"
+    assert config.version == 0
+
+
+def test_config_cipher_cached_until_key_changes(tmp_path):
+    """Reuse the cipher across calls and rebuild it once the key file is replaced."""
+    manager = ConfigManager(config_path=tmp_path / "config.json", key_path=tmp_path / "key.key")
+    manager.save(AppConfig(api_key="secret"))
+    cipher = manager._get_cipher()
+    assert manager._get_cipher() is cipher
+
+    replacement = ConfigManager(config_path=tmp_path / "other.json", key_path=tmp_path / "other.key")
+    manager.key_path.write_bytes(replacement.key_path.read_bytes())
+    os.utime(manager.key_path, ns=(0, 0))
+    assert manager._get_cipher() is not cipher
+
+
+def test_config_save_replaces_file_atomically(tmp_path):
+    """Saving twice leaves only the final config and no temporary file behind."""
+    config_path = tmp_path / "config.json"
+    manager = ConfigManager(config_path=config_path, key_path=tmp_path / "key.key")
+    manager.save(AppConfig(output_dir="/first"))
+    manager.save(AppConfig(output_dir="/second"))
+
+    assert manager.load().output_dir == "/second"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["config.json", "key.key"]
+
+
+def test_config_save_skips_rewrite_when_unchanged(tmp_path):
+    """Saving identical settings keeps the same token and does not touch the file."""
+    config_path = tmp_path / "config.json"
+    manager = ConfigManager(config_path=config_path, key_path=tmp_path / "key.key")
+    config = AppConfig(api_key="secret", output_dir="/data")
+    manager.save(config)
+    first_bytes = config_path.read_bytes()
+    os.utime(config_path, ns=(0, 0))
+
+    manager.save(config)
+    assert config_path.stat().st_mtime_ns == 0
+    assert config_path.read_bytes() == first_bytes
+
+    reloaded = ConfigManager(config_path=config_path, key_path=tmp_path / "key.key")
+    reloaded.save(reloaded.load())
+    assert config_path.stat().st_mtime_ns == 0
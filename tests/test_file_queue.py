@@ -0,0 +1,49 @@
+"""Unit tests covering the file queue item model."""
+
+from PySide6.QtCore import Qt
+
+from core.models import TaskStatus
+from widgets.file_queue import FileQueueModel, _QueueRow
+
+
+def _row(name):
+    """Return a pending queue row keyed by its name."""
+    return _QueueRow(name, TaskStatus.PENDING, [name, "待上传", "待上传", "0", ""])
+
+
+def test_queue_model_keeps_index_in_sync_with_rows():
+    """Insert, update and remove rows while key lookups keep pointing at the right row."""
+    model = FileQueueModel()
+    inserted = []
+    model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+    model.append_rows([_row("a"), _row("b"), _row("c"), _row("d")])
+    assert inserted == [(0, 3)]
+
+    model.update_row(model.row_of("c"), TaskStatus.FAILED, ["失败", "上传失败", "1", "boom"])
+    assert model.data(model.index(2, 4)) == "boom"
+    assert model.data(model.index(2, 1), Qt.UserRole) == TaskStatus.FAILED.value
+
+    assert model.remove_keys(["a", "missing", "c"])
+    assert model.keys() == ["b", "d"]
+    assert model.row_of("d") == 1
+    assert model.row_of_name("d") == 1
+    assert model.row_of_name("a") is None
+    assert not model.remove_keys(["a"])
+
+    model.reset_rows([_row("e")])
+    assert model.rowCount() == 1 and model.row_of("b") is None
+    assert model.row_of_name("e") == 0
+
+
+def test_queue_model_removes_contiguous_rows_in_one_notification():
+    """Group adjacent rows into a single remove per run, bottom-up."""
+    model = FileQueueModel()
+    model.append_rows([_row(name) for name in "abcdefg"])
+    removed = []
+    model.rowsRemoved.connect(lambda _parent, first, last: removed.append((first, last)))
+
+    assert model.remove_keys(["b", "c", "d", "f", "g"])
+
+    assert removed == [(5, 6), (1, 3)]
+    assert model.keys() == ["a", "e"]
+    assert model.row_of("e") == 1
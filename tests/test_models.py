@@ -0,0 +1,51 @@
+"""Unit tests covering the shared data models."""
+
+import os
+from pathlib import Path
+
+from core.models import BatchTask, TaskStatus, UploadFile
+
+
+def test_batch_task_status_counts():
+    """Count successes and failures across a mixed batch in one pass."""
+    task = BatchTask(
+        batch_id="batch-1",
+        files=[
+            UploadFile(path=Path("a.pdf"), display_name="a.pdf", status=TaskStatus.COMPLETED),
+            UploadFile(path=Path("b.pdf"), display_name="b.pdf", status=TaskStatus.FAILED),
+            UploadFile(path=Path("c.pdf"), display_name="c.pdf", status=TaskStatus.COMPLETED),
+            UploadFile(path=Path("d.pdf"), display_name="d.pdf"),
+        ],
+    )
+    assert task.success_count() == 2
+    assert task.failure_count() == 1
+    assert task.status_counts()[TaskStatus.PENDING] == 1
+
+
+def test_upload_file_as_dict_reflects_current_fields():
+    """Build a fresh snapshot on each call so later field updates show up."""
+    upload = UploadFile(path=Path("a.pdf"), display_name="a.pdf")
+    first = upload.as_dict()
+    first["status"] = "mutated"
+
+    upload.status = TaskStatus.COMPLETED
+    assert upload.as_dict()["status"] == "completed"
+    assert upload == UploadFile(path=Path("a.pdf"), display_name="a.pdf", status=TaskStatus.COMPLETED)
+
+
+def test_upload_file_stem_follows_display_name():
+    """Derive the stem from the current display name."""
+    upload = UploadFile(path=Path("dir/report.v2.pdf"), display_name="report.v2.pdf")
+    assert upload.stem == "report.v2"
+
+    upload.display_name = "summary.pdf"
+    assert upload.stem == "summary"
+
+
+def test_upload_file_resolved_key_follows_path(tmp_path):
+    """Normalise the current path lexically."""
+    upload = UploadFile(path=tmp_path / "sub" / ".." / "a.pdf", display_name="a.pdf")
+    assert upload.resolved_key == os.path.join(str(tmp_path), "a.pdf")
+
+    upload.path = tmp_path / "b.pdf"
+    assert upload.resolved_key == os.path.join(str(tmp_path), "b.pdf")
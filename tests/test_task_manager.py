@@ -0,0 +1,213 @@
+"""Unit tests covering result extraction and history persistence in the task manager."""
+
+import io
+import json
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from core.config import AppConfig
+from core.models import BatchTask, UploadFile
+from services.task_manager import TaskManager, _store_result_package
+
+
+@pytest.fixture
+def history_paths(tmp_path, monkeypatch):
+    """Point the task manager's history files into a temporary directory."""
+    log_path = tmp_path / "history.jsonl"
+    legacy_path = tmp_path / "history.json"
+    monkeypatch.setattr(TaskManager, "HISTORY_FILE", log_path)
+    monkeypatch.setattr(TaskManager, "LEGACY_HISTORY_FILE", legacy_path)
+    return log_path, legacy_path
+
+
+def _build_package(members):
+    """Return an in-memory ZIP containing the given name/content pairs."""
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+def test_store_result_package_extracts_and_mirrors_markdown(tmp_path):
+    """Extract every member and mirror full.md next to the result folder."""
+    task = BatchTask(batch_id="batch-1", output_dir=tmp_path / "batch-1")
+    file_item = UploadFile(path=Path("report.pdf"), display_name="report.pdf")
+    package = _build_package({"nested/full.md": "# Report", "images/a.png": b"png"})
+    messages = []
+
+    target_dir = _store_result_package(task, tmp_path, file_item, package, messages.append)
+
+    assert target_dir == tmp_path / "batch-1" / "report"
+    assert (target_dir / "images" / "a.png").read_bytes() == b"png"
+    assert (tmp_path / "batch-1" / "report.md").read_text(encoding="utf-8") == "# Report"
+    assert messages == []
+
+
+def test_store_result_package_prunes_stale_files_on_reextract(tmp_path):
+    """Overwrite an existing result folder in place and drop members that disappeared."""
+    task = BatchTask(batch_id="batch-1", output_dir=tmp_path / "batch-1")
+    file_item = UploadFile(path=Path("report.pdf"), display_name="report.pdf")
+    first = _build_package({"full.md": "v1", "old/a.png": b"a", "keep/b.png": b"b"})
+    _store_result_package(task, tmp_path, file_item, first, lambda _msg: None)
+
+    second = _build_package({"full.md": "v2", "keep/b.png": b"b2"})
+    target_dir = _store_result_package(task, tmp_path, file_item, second, lambda _msg: None)
+
+    assert (target_dir / "full.md").read_text(encoding="utf-8") == "v2"
+    assert (target_dir / "keep" / "b.png").read_bytes() == b"b2"
+    assert not (target_dir / "old").exists()
+    assert (tmp_path / "batch-1" / "report.md").read_text(encoding="utf-8") == "v2"
+
+
+def test_store_result_package_keeps_files_when_output_dir_has_parent_refs(tmp_path):
+    """Match extracted and walked paths even when the batch folder is spelled with '..'."""
+    (tmp_path / "x").mkdir()
+    task = BatchTask(batch_id="batch-1", output_dir=tmp_path / "x" / ".." / "batch-1")
+    file_item = UploadFile(path=Path("report.pdf"), display_name="report.pdf")
+    members = {"full.md": "v1", "images/a.png": b"a"}
+    _store_result_package(task, tmp_path, file_item, _build_package(members), lambda _msg: None)
+    messages = []
+
+    target_dir = _store_result_package(task, tmp_path, file_item, _build_package(members), messages.append)
+
+    assert (target_dir / "full.md").read_text(encoding="utf-8") == "v1"
+    assert (target_dir / "images" / "a.png").read_bytes() == b"a"
+    assert messages == []
+
+
+def test_store_result_package_warns_without_markdown(tmp_path):
+    """Log a warning when the package does not contain full.md."""
+    task = BatchTask(batch_id="batch-1", output_dir=tmp_path / "batch-1")
+    file_item = UploadFile(path=Path("report.pdf"), display_name="report.pdf")
+    messages = []
+
+    _store_result_package(task, tmp_path, file_item, _build_package({"content.json": "{}"}), messages.append)
+
+    assert not (tmp_path / "batch-1" / "report.md").exists()
+    assert len(messages) == 1
+
+
+def test_history_log_replays_latest_entry_per_batch(history_paths):
+    """Append one line per update and rebuild the newest state on reload."""
+    log_path, _ = history_paths
+    manager = TaskManager(api_client=None, config=AppConfig())
+    manager._update_history_entry("batch-1", status="uploading", output_dir="out")
+    manager._update_history_entry("batch-2", status="uploading")
+    manager.flush_history(wait=True)
+    manager._update_history_entry("batch-1", status="completed", success=3)
+    manager.flush_history(wait=True)
+
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 3
+    history = TaskManager(api_client=None, config=AppConfig()).get_history()
+    assert [entry["batch_id"] for entry in history] == ["batch-2", "batch-1"]
+    assert history[1]["status"] == "completed"
+    assert history[1]["success"] == 3
+    assert history[1]["output_dir"] == "out"
+
+
+def test_history_migrates_legacy_file_and_compacts(history_paths):
+    """Import the old JSON list once and keep the log bounded by compaction."""
+    log_path, legacy_path = history_paths
+    legacy = [{"batch_id": "new", "status": "failed"}, {"batch_id": "old", "completed_at": "2024-01-01"}]
+    legacy_path.write_text(json.dumps(legacy), encoding="utf-8")
+
+    config = AppConfig(history_limit=2)
+    manager = TaskManager(api_client=None, config=config)
+    assert [entry["batch_id"] for entry in manager.get_history()] == ["new", "old"]
+    assert manager.get_history()[1]["status"] == "completed"
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    for _ in range(TaskManager.HISTORY_COMPACT_FACTOR * config.history_limit):
+        manager._update_history_entry("new", status="processing")
+        manager.flush_history(wait=True)
+    compact_threshold = TaskManager.HISTORY_COMPACT_FACTOR * config.history_limit
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) < compact_threshold
+    manager._update_history_entry("newest", status="uploading")
+    manager.flush_history(wait=True)
+
+    reloaded = TaskManager(api_client=None, config=config).get_history()
+    assert [entry["batch_id"] for entry in reloaded] == ["newest", "new"]
+
+
+def test_history_updates_are_coalesced_until_flush(history_paths):
+    """Buffer a burst of updates and write and broadcast them in one flush."""
+    log_path, _ = history_paths
+    manager = TaskManager(api_client=None, config=AppConfig())
+    broadcasts = []
+    manager.history_updated.connect(broadcasts.append)
+
+    manager._update_history_entry("batch-1", status="uploading")
+    manager._update_history_entry("batch-2", status="uploading")
+    manager._update_history_entry("batch-1", status="processing")
+    assert not log_path.exists()
+    assert broadcasts == []
+
+    manager.flush_history(wait=True)
+    lines = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert [(line["batch_id"], line["status"]) for line in lines] == [
+        ("batch-1", "processing"),
+        ("batch-2", "uploading"),
+    ]
+    assert len(broadcasts) == 1
+
+
+def test_history_snapshots_are_not_mutated_by_updates(history_paths):
+    """Hand out entries without copying while later updates replace rather than mutate them."""
+    manager = TaskManager(api_client=None, config=AppConfig())
+    manager._update_history_entry("batch-1", status="uploading", files=[{"path": "a.pdf", "display_name": "a.pdf"}])
+    snapshot = manager.get_history()[0]
+
+    manager._update_history_entry("batch-1", status="completed")
+
+    assert snapshot["status"] == "uploading"
+    assert isinstance(snapshot["files"], tuple)
+    assert manager.get_history()[0]["status"] == "completed"
+
+
+def test_files_from_history_reuses_parsed_paths_until_entry_changes(history_paths):
+    """Parse each entry's paths once and reparse after the entry is replaced."""
+    manager = TaskManager(api_client=None, config=AppConfig())
+    files = [{"path": "docs/a.pdf", "display_name": "a.pdf"}, {"path": "", "display_name": "b.pdf"}]
+    entry = manager._update_history_entry("batch-1", status="processing", files=files)
+
+    first = manager._files_from_history(entry)
+    second = manager._files_from_history(manager._find_history_entry("batch-1"))
+    assert [(f.path, f.display_name) for f in first] == [(Path("docs/a.pdf"), "a.pdf"), (Path("b.pdf"), "b.pdf")]
+    assert first[0].path is second[0].path
+    assert first[0] is not second[0]
+
+    updated = manager._update_history_entry("batch-1", files=[{"path": "c.pdf", "display_name": "c.pdf"}])
+    assert [f.display_name for f in manager._files_from_history(updated)] == ["c.pdf"]
+
+
+def test_history_skips_updates_that_change_nothing(history_paths):
+    """Leave the log and listeners untouched when an update repeats the stored values."""
+    log_path, _ = history_paths
+    manager = TaskManager(api_client=None, config=AppConfig())
+    entry = manager._update_history_entry("batch-1", status="processing", last_error=None)
+    manager.flush_history(wait=True)
+    broadcasts = []
+    manager.history_updated.connect(broadcasts.append)
+
+    assert manager._update_history_entry("batch-1", status="processing", last_error=None) is entry
+    manager.flush_history(wait=True)
+
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 1
+    assert broadcasts == []
+
+
+def test_files_from_history_cache_is_evicted_with_trimmed_entries(history_paths):
+    """Drop cached paths when their history entry falls off the history limit."""
+    manager = TaskManager(api_client=None, config=AppConfig(history_limit=2))
+    files = [{"path": "a.pdf", "display_name": "a.pdf"}]
+    for batch_id in ("batch-1", "batch-2"):
+        manager._files_from_history(manager._update_history_entry(batch_id, status="processing", files=files))
+    assert set(manager._history_paths) == {"batch-1", "batch-2"}
+
+    manager._update_history_entry("batch-3", status="uploading")
+
+    assert set(manager._history_paths) == {"batch-2"}
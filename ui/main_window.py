@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from collections import Counter
 from pathlib import Path
 from typing import Iterable, List
 
@@ -52,10 +54,13 @@ class MainWindow(QMainWindow):
 
         self.config_manager = ConfigManager()
         self.config = self.config_manager.load()
-        self.api_client = MinerUApiClient(self.config.api_key or "")
+        self._api_key = self.config.api_key or ""
+        self.api_client = MinerUApiClient(self._api_key)
         self.task_manager = TaskManager(self.api_client, self.config)
         self._current_files: dict[str, UploadFile] = {}
         self._is_running = False
+        # (output dir text, validity) of the last filesystem check
+        self._output_dir_cache: tuple[str, bool] | None = None
 
         self._init_ui()
         self._load_config_to_ui()
@@ -208,6 +213,7 @@ class MainWindow(QMainWindow):
         """Wire widget events and task manager signals to their handlers."""
         self.file_queue.files_changed.connect(self._update_summary_from_queue)
         self.file_queue.retry_requested.connect(self._on_retry_requested)
+        self.log_view.export_finished.connect(self._on_log_exported)
 
         self.output_dir_input.textChanged.connect(self._on_output_dir_changed)
         self.task_manager.batch_started.connect(self._on_batch_started)
@@ -222,22 +228,18 @@ class MainWindow(QMainWindow):
         self.history_view.redownload_requested.connect(self._on_history_redownload_requested)
 
     def _build_upload_files_from_entry(self, entry: dict) -> List[UploadFile]:
-        """Recreate UploadFile instances from history entries."""
+        """Recreate UploadFile instances from history entries.
+
+        Entries come from the task manager, which canonicalises every file record to
+        ``{"path": str, "display_name": str}`` when history is loaded or updated.
+        """
         uploads: List[UploadFile] = []
-        for info in entry.get("files") or []:
-            if isinstance(info, dict):
-                path_text = info.get("path") or ""
-                display = info.get("display_name") or path_text or "未命名文件"
-            else:
-                path_text = str(info)
-                display = Path(path_text).name if path_text else "未命名文件"
-            try:
-                path_obj = Path(path_text) if path_text else Path(display)
-            except Exception:
-                path_obj = Path(display)
+        for info in entry.get("files") or ():
+            path_text = info["path"]
+            display = info["display_name"] or path_text or "未命名文件"
             uploads.append(
                 UploadFile(
-                    path=path_obj,
+                    path=Path(path_text or display),
                     display_name=display,
                     status=TaskStatus.PENDING,
                     progress_label="等待解析",
@@ -282,8 +284,11 @@ class MainWindow(QMainWindow):
         self.config = config
         self.config_manager.save(config)
         self.task_manager.update_config(config)
-        self.api_client = MinerUApiClient(config.api_key or "")
-        self.task_manager.set_api_client(self.api_client)
+        api_key = config.api_key or ""
+        if api_key != self._api_key:
+            self._api_key = api_key
+            self.api_client = MinerUApiClient(api_key)
+            self.task_manager.set_api_client(self.api_client)
 
     # Slots
     def _start_processing(self) -> None:
@@ -301,7 +306,7 @@ class MainWindow(QMainWindow):
         if not files:
             QMessageBox.warning(self, "缺少文件", "请先添加至少一个 PDF 文件。")
             return
-        if not self._is_output_dir_valid():
+        if not self._is_output_dir_valid(refresh=True):
             QMessageBox.critical(self, "输出目录无效", "所选输出目录不存在或不可访问。")
             self._update_start_button_state()
             return
@@ -310,7 +315,7 @@ class MainWindow(QMainWindow):
 
         try:
             self._current_files = {}
-            self.task_manager.start_batch([Path(path) for path in files], Path(output_dir))
+            self.task_manager.start_batch(files, output_dir)
             self._toggle_controls(active=True)
         except Exception as exc:  # pylint: disable=broad-except
             logger.exception("Failed to start batch: %s", exc)
@@ -377,7 +382,7 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(100)
 
         if kind == "standard":
-            self._current_files = {str(f.path.resolve()): f for f in task.files}
+            self._current_files = {f.resolved_key: f for f in task.files}
             self._update_summary(task.files)
             completed_keys = list(self._current_files.keys())
             if completed_keys:
@@ -385,7 +390,7 @@ class MainWindow(QMainWindow):
             self._current_files.clear()
             self._update_summary([])
         else:
-            self._current_files = {str(f.path.resolve()): f for f in task.files}
+            self._current_files = {f.resolved_key: f for f in task.files}
             self._update_summary(task.files)
         self._current_files.clear()
 
@@ -414,7 +419,7 @@ class MainWindow(QMainWindow):
 
     def _on_file_updated(self, display_name: str, file_info: UploadFile) -> None:
         """Update UI elements when individual file progress changes."""
-        self._current_files[str(file_info.path.resolve())] = file_info
+        self._current_files[file_info.resolved_key] = file_info
         self.file_queue.update_file(file_info)
         self._update_summary(self._current_files.values())
         status_message = f"{display_name}: {file_info.progress_label}"
@@ -426,6 +431,13 @@ class MainWindow(QMainWindow):
         """Append a new line to the runtime log viewer."""
         self.log_view.append(message)
 
+    def _on_log_exported(self, path: str, error: str) -> None:
+        """Tell the user where the log was exported, or why the export failed."""
+        if error:
+            QMessageBox.critical(self, "导出日志失败", error)
+        else:
+            self.statusBar().showMessage(f"日志已导出至 {path}", 5000)
+
     def _on_polling_status(self, message: str) -> None:
         """Display status updates in both the label and status bar."""
         self.polling_label.setText(message)
@@ -434,23 +446,21 @@ class MainWindow(QMainWindow):
 
     def _update_summary(self, files: Iterable[UploadFile]) -> None:
         """Recalculate the status summary widget based on provided files."""
-        snapshot = list(files)
-        total = len(snapshot)
-        completed = sum(1 for f in snapshot if f.status == TaskStatus.COMPLETED)
-        failed = sum(1 for f in snapshot if f.status == TaskStatus.FAILED)
+        counts = Counter(f.status for f in files)
+        total = sum(counts.values())
+        completed = counts[TaskStatus.COMPLETED]
+        failed = counts[TaskStatus.FAILED]
         pending = total - completed - failed
         self.status_summary.update_counts(total, completed, failed, pending)
 
-    def _update_summary_from_queue(self, _paths: List[str]) -> None:
+    def _update_summary_from_queue(self, paths: List[str]) -> None:
         """Refresh the summary whenever the queued file set changes."""
         if self._current_files:
             self._update_summary(self._current_files.values())
             return
-        files = [
-            UploadFile(path=Path(p), display_name=Path(p).name)
-            for p in self.file_queue.all_files()
-        ]
-        self._update_summary(files)
+        # Without an active batch every queued file is still pending.
+        total = len(paths)
+        self.status_summary.update_counts(total, 0, 0, total)
 
     def _toggle_controls(self, active: bool) -> None:
         """Toggle buttons and queue interactivity while work is in progress."""
@@ -498,17 +508,7 @@ class MainWindow(QMainWindow):
 
     def _show_reupload_prompt(self, task, reason: str) -> None:
         """Display a dialog advising the user to re-upload missing files."""
-        file_paths = []
-        for file_info in getattr(task, "files", []):
-            path_value = getattr(file_info, "path", None)
-            display_name = getattr(file_info, "display_name", "")
-            if path_value:
-                try:
-                    file_paths.append(str(Path(path_value)))
-                except TypeError:
-                    file_paths.append(display_name or str(path_value))
-            elif display_name:
-                file_paths.append(display_name)
+        file_paths = [str(file_info.path) for file_info in task.files]
         if not file_paths:
             return
         self._show_reupload_details(task.batch_id, file_paths, reason)
@@ -525,20 +525,28 @@ class MainWindow(QMainWindow):
 
     def _on_output_dir_changed(self, _text: str) -> None:
         """React to direct edits in the output field by revalidating the path."""
+        self._output_dir_cache = None
         if self.output_dir_input.text().strip() and not self._is_output_dir_valid():
             self.statusBar().showMessage("输出目录不存在或不可访问", 5000)
         self._update_start_button_state()
 
-    def _is_output_dir_valid(self) -> bool:
-        """Return True when the output directory exists and is a folder."""
+    def _is_output_dir_valid(self, refresh: bool = False) -> bool:
+        """Return True when the output directory exists and is a folder.
+
+        The result is cached per field text; pass ``refresh`` to hit the filesystem again.
+        """
         text = self.output_dir_input.text().strip()
         if not text:
             return False
+        cached = self._output_dir_cache
+        if not refresh and cached is not None and cached[0] == text:
+            return cached[1]
         try:
-            path = Path(text).expanduser()
+            valid = os.path.isdir(os.path.expanduser(text))
         except (TypeError, ValueError, OSError):
-            return False
-        return path.exists() and path.is_dir()
+            valid = False
+        self._output_dir_cache = (text, valid)
+        return valid
 
     def _update_start_button_state(self) -> None:
         """Keep the start button disabled unless the form is ready."""
@@ -559,5 +567,7 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
             self.task_manager.cancel_active_batch()
+        self.task_manager.flush_history(wait=True)
+        self.log_view.shutdown()
         self._persist_config()
         super().closeEvent(event)
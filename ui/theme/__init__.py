@@ -1,14 +1,24 @@
 """Utility helpers for applying the bundled Qt stylesheet."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtWidgets import QApplication
 
 
+@lru_cache(maxsize=8)
+def _load_qss(theme_name: str) -> Optional[str]:
+    """Read a bundled theme once; return None when no such theme exists."""
+    theme_path = Path(__file__).resolve().parent / f"{theme_name}.qss"
+    try:
+        return theme_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
 def apply_theme(app: QApplication, theme_name: str = "dark") -> None:
     """Apply the chosen QSS theme to a QApplication instance."""
-    theme_path = Path(__file__).resolve().parent / f"{theme_name}.qss"
-    if not theme_path.exists():
-        return
-    app.setStyleSheet(theme_path.read_text(encoding="utf-8"))
+    qss = _load_qss(theme_name)
+    if qss:
+        app.setStyleSheet(qss)
@@ -2,21 +2,23 @@
 
 from __future__ import annotations
 
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt, QTimer, Signal
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QFileDialog,
     QHBoxLayout,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
-from core.models import TaskStatus, UploadFile
+from core.models import TaskStatus, UploadFile, path_key
 
 
 STATUS_LABELS = {
@@ -27,19 +29,181 @@ STATUS_LABELS = {
     TaskStatus.FAILED: "失败",
     TaskStatus.CANCELLED: "已取消",
 }
+# Every status mapped up front so row updates need a single lookup and no fallback.
+STATUS_LABELS_FULL = {status: STATUS_LABELS.get(status, status.value) for status in TaskStatus}
 
 
-class _FileTreeWidget(QTreeWidget):
-    """Custom tree widget that supports drag and drop of file paths."""
+@dataclass(slots=True)
+class _QueueRow:
+    """Display state of one queued file; a copy, never the worker's live object."""
+
+    key: str
+    status: TaskStatus
+    texts: List[str]
+
+
+class FileQueueModel(QAbstractItemModel):
+    """Flat item model holding the queue rows plus key -> row and name -> key indexes."""
+
+    HEADERS = ("文件名", "状态", "阶段", "尝试次数", "错误信息")
+
+    def __init__(self, parent=None) -> None:
+        """Start with an empty queue."""
+        super().__init__(parent)
+        self._rows: List[_QueueRow] = []
+        self._index: Dict[str, int] = {}
+        # display name -> key of the first row showing that name
+        self._by_name: Dict[str, str] = {}
+
+    # Qt model interface
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of queued files (top level only)."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the fixed number of queue columns."""
+        return len(self.HEADERS)
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """Create an index for a top-level cell."""
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        """Return an invalid parent; the queue is a flat list."""
+        return QModelIndex()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Return cell text, or the key/status value under UserRole."""
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return row.texts[index.column()]
+        if role == Qt.UserRole:
+            if index.column() == 0:
+                return row.key
+            if index.column() == 1:
+                return row.status.value
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        """Return the column titles for the horizontal header."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """Rows are selectable but not editable."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # Queue operations
+    def keys(self) -> List[str]:
+        """Return the keys of all rows in display order."""
+        return [row.key for row in self._rows]
+
+    def has_key(self, key: str) -> bool:
+        """Return whether a row with the given key exists."""
+        return key in self._index
+
+    def row_of(self, key: str) -> Optional[int]:
+        """Return the row holding the given key, if any."""
+        return self._index.get(key)
+
+    def row_of_name(self, display_name: str) -> Optional[int]:
+        """Return the first row showing the given file name, if any."""
+        key = self._by_name.get(display_name)
+        return None if key is None else self._index.get(key)
+
+    def key_at(self, position: int) -> str:
+        """Return the key stored in the given row."""
+        return self._rows[position].key
+
+    def status_at(self, position: int) -> TaskStatus:
+        """Return the status stored in the given row."""
+        return self._rows[position].status
+
+    def reset_rows(self, rows: List[_QueueRow]) -> None:
+        """Replace every row with a single model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self._reindex()
+        self.endResetModel()
+
+    def append_rows(self, rows: List[_QueueRow]) -> None:
+        """Append rows with a single insert notification."""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for offset, row in enumerate(rows):
+            self._index[row.key] = first + offset
+            self._by_name.setdefault(row.texts[0], row.key)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def update_row(self, position: int, status: TaskStatus, texts: List[str]) -> None:
+        """Overwrite a row's status columns and notify views of the changed cells."""
+        row = self._rows[position]
+        row.status = status
+        row.texts[1:] = texts
+        self.dataChanged.emit(
+            self.createIndex(position, 1),
+            self.createIndex(position, len(self.HEADERS) - 1),
+            [Qt.DisplayRole, Qt.UserRole],
+        )
+
+    def remove_keys(self, keys: Iterable[str]) -> bool:
+        """Remove the rows holding the given keys; return whether any were removed."""
+        positions = sorted({self._index[key] for key in keys if key in self._index}, reverse=True)
+        if not positions:
+            return False
+        # Remove contiguous runs bottom-up so earlier rows keep their positions.
+        last = first = positions[0]
+        for position in positions[1:]:
+            if position == first - 1:
+                first = position
+                continue
+            self._remove_range(first, last)
+            last = first = position
+        self._remove_range(first, last)
+        self._reindex()
+        return True
+
+    def _reindex(self) -> None:
+        """Rebuild both lookup indexes from the current rows."""
+        self._index = {}
+        self._by_name = {}
+        for position, row in enumerate(self._rows):
+            self._index[row.key] = position
+            self._by_name.setdefault(row.texts[0], row.key)
+
+    def _remove_range(self, first: int, last: int) -> None:
+        """Drop rows first..last (inclusive) with one remove notification."""
+        self.beginRemoveRows(QModelIndex(), first, last)
+        del self._rows[first : last + 1]
+        self.endRemoveRows()
+
+
+class _FileTreeView(QTreeView):
+    """Custom tree view that supports drag and drop of file paths."""
 
     files_dropped = Signal(list)
 
-    def __init__(self) -> None:
-        """Initialise headers, drag/drop behaviour, and selection policy."""
+    def __init__(self, model: FileQueueModel) -> None:
+        """Initialise the model, drag/drop behaviour, and selection policy."""
         super().__init__()
+        self.setModel(model)
         self.setAcceptDrops(True)
-        self.setHeaderLabels(["文件名", "状态", "阶段", "尝试次数", "错误信息"])
-        self.setSelectionMode(QTreeWidget.ExtendedSelection)
+        self.setRootIsDecorated(False)
+        self.setItemsExpandable(False)
+        # Rows are single-line text, so measuring one row sizes them all.
+        self.setUniformRowHeights(True)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.setColumnWidth(0, 260)
         self.setColumnWidth(1, 80)
         self.setColumnWidth(2, 160)
@@ -75,14 +239,22 @@ class FileQueueWidget(QWidget):
     files_changed = Signal(list)
     retry_requested = Signal(str)
 
+    CHANGED_SIGNAL_DELAY_MS = 50
+
     def __init__(self, parent=None) -> None:
-        """Set up the widget tree and prepare internal bookkeeping."""
+        """Set up the queue model and view."""
         super().__init__(parent)
-        self._items: Dict[str, QTreeWidgetItem] = {}
+        self.model = FileQueueModel(self)
+        # Bursts of progress updates collapse into one files_changed per interval;
+        # adding or removing files still notifies immediately.
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(self.CHANGED_SIGNAL_DELAY_MS)
+        self._changed_timer.timeout.connect(self._flush_changed)
         self._init_ui()
 
     def _init_ui(self) -> None:
-        """Create buttons, wire events, and embed the tree widget."""
+        """Create buttons, wire events, and embed the tree view."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
@@ -102,150 +274,98 @@ class FileQueueWidget(QWidget):
         button_row.addStretch()
         layout.addLayout(button_row)
 
-        self.tree = _FileTreeWidget()
+        self.tree = _FileTreeView(self.model)
         self.tree.files_dropped.connect(self._handle_dropped_files)
-        self.tree.itemDoubleClicked.connect(self._handle_item_double_clicked)
-        self.tree.setStyleSheet(
-            """
-            QTreeWidget {
-                selection-background-color: #24262a;
-                selection-color: #ffffff;
-            }
-            QTreeWidget::item:selected {
-                background-color: #1f6fb2;
-                color: #ffffff;
-            }
-            QTreeWidget::item:selected:active {
-                background-color: #4a90e2;
-                color: #ffffff;
-            }
-            QTreeWidget::item:selected:!active {
-                background-color: #1f3652;
-                color: #ffffff;
-            }
-            """
-        )
+        self.tree.doubleClicked.connect(self._handle_double_clicked)
+        self.tree.setObjectName("fileQueueTree")
         layout.addWidget(self.tree)
 
     def _key_for_path(self, path: Path | str) -> str:
         """Return a normalised absolute path string used as dictionary key."""
-        if isinstance(path, Path):
-            try:
-                return str(path.expanduser().resolve())
-            except Exception:
-                return str(path)
-        try:
-            return str(Path(path).expanduser().resolve())
-        except Exception:
-            return str(path)
+        return path_key(str(path))
+
+    @staticmethod
+    def _status_texts(file_info: UploadFile, progress_text: str) -> List[str]:
+        """Return the status, stage, attempts and error cells for a file."""
+        status_text = STATUS_LABELS_FULL[file_info.status]
+        return [status_text, progress_text, str(file_info.attempts), file_info.error or ""]
 
     def add_files(self, paths: Iterable[str | Path]) -> None:
         """Add new files to the queue, ignoring duplicates and non-PDF inputs."""
-        accepted: List[str] = []
-        for raw_path in paths:
-            path = Path(raw_path)
-            if not path.exists() or path.suffix.lower() != ".pdf":
+        # Filter on the suffix first so non-PDF drops never cost a stat call.
+        candidates = [text for text in map(str, paths) if text.lower().endswith(".pdf") and os.path.isfile(text)]
+        accepted: List[_QueueRow] = []
+        seen = set()
+        status_text = STATUS_LABELS_FULL[TaskStatus.PENDING]
+        for text in candidates:
+            key = self._key_for_path(text)
+            if key in seen or self.model.has_key(key):
                 continue
-            key = self._key_for_path(path)
-            if key in self._items:
-                continue
-            status_text = STATUS_LABELS.get(TaskStatus.PENDING, TaskStatus.PENDING.value)
-            item = QTreeWidgetItem(
-                [path.name, status_text, "待上传", "0", ""]
-            )
-            item.setData(0, Qt.UserRole, key)
-            item.setData(1, Qt.UserRole, TaskStatus.PENDING.value)
-            self.tree.addTopLevelItem(item)
-            self._items[key] = item
-            accepted.append(key)
+            seen.add(key)
+            texts = [os.path.basename(key), status_text, "待上传", "0", ""]
+            accepted.append(_QueueRow(key, TaskStatus.PENDING, texts))
         if accepted:
-            self.files_changed.emit(list(self._items.keys()))
+            self.model.append_rows(accepted)
+            self._flush_changed()
 
     def load_from_files(self, files: Iterable[UploadFile]) -> None:
         """Replace the current queue contents with provided UploadFile objects."""
-        self.tree.clear()
-        self._items.clear()
+        rows: List[_QueueRow] = []
+        seen = set()
         for file_info in files:
             key = self._key_for_path(file_info.path)
-            status_text = STATUS_LABELS.get(file_info.status, file_info.status.value)
-            progress_text = file_info.progress_label or status_text
-            item = QTreeWidgetItem(
-                [
-                    file_info.display_name,
-                    status_text,
-                    progress_text,
-                    str(file_info.attempts),
-                    file_info.error or "",
-                ]
-            )
-            item.setData(0, Qt.UserRole, key)
-            item.setData(1, Qt.UserRole, file_info.status.value)
-            self.tree.addTopLevelItem(item)
-            self._items[key] = item
-        self.files_changed.emit(list(self._items.keys()))
+            if key in seen:
+                continue
+            seen.add(key)
+            status_text = STATUS_LABELS_FULL[file_info.status]
+            texts = self._status_texts(file_info, file_info.progress_label or status_text)
+            rows.append(_QueueRow(key, file_info.status, [file_info.display_name, *texts]))
+        self.model.reset_rows(rows)
+        self._flush_changed()
 
     def update_file(self, file_info: UploadFile) -> None:
-        """Update an existing item to reflect fresh status information."""
+        """Update an existing row to reflect fresh status information."""
         key = self._key_for_path(file_info.path)
-        item = self._items.get(key)
-        if not item:
+        position = self.model.row_of(key)
+        if position is None:
             # fallback to name-based lookup if absolute path differs (e.g., remote rename)
-            for candidate_key, candidate_item in self._items.items():
-                if candidate_item.text(0) == file_info.display_name:
-                    item = candidate_item
-                    key = candidate_key
-                    break
-        if not item:
-            status_text = STATUS_LABELS.get(file_info.status, file_info.status.value)
-            item = QTreeWidgetItem(
-                [
-                    file_info.display_name,
-                    status_text,
-                    file_info.progress_label,
-                    str(file_info.attempts),
-                    file_info.error or "",
-                ]
-            )
-            item.setData(0, Qt.UserRole, key)
-            item.setData(1, Qt.UserRole, file_info.status.value)
-            self.tree.addTopLevelItem(item)
-            self._items[key] = item
-        status_text = STATUS_LABELS.get(file_info.status, file_info.status.value)
-        item.setText(1, status_text)
-        item.setData(1, Qt.UserRole, file_info.status.value)
-        item.setText(2, file_info.progress_label)
-        item.setText(3, str(file_info.attempts))
-        item.setText(4, file_info.error or "")
-        self.files_changed.emit(list(self._items.keys()))
+            position = self.model.row_of_name(file_info.display_name)
+        texts = self._status_texts(file_info, file_info.progress_label)
+        if position is None:
+            self.model.append_rows([_QueueRow(key, file_info.status, [file_info.display_name, *texts])])
+        else:
+            self.model.update_row(position, file_info.status, texts)
+        self._schedule_changed()
 
     def remove_file(self, key: str) -> None:
         """Remove a single file from the queue by its lookup key."""
-        item = self._items.pop(key, None)
-        if item:
-            index = self.tree.indexOfTopLevelItem(item)
-            if index >= 0:
-                self.tree.takeTopLevelItem(index)
-            self.files_changed.emit(list(self._items.keys()))
+        self.remove_files([key])
 
     def remove_files(self, keys: Iterable[str]) -> None:
         """Remove multiple files from the queue in one pass."""
-        changed = False
-        for key in list(keys):
-            item = self._items.pop(key, None)
-            if not item:
-                continue
-            index = self.tree.indexOfTopLevelItem(item)
-            if index >= 0:
-                self.tree.takeTopLevelItem(index)
-            changed = True
-        if changed:
-            self.files_changed.emit(list(self._items.keys()))
+        # Scattered selections remove one run at a time; repaint once at the end.
+        self.tree.setUpdatesEnabled(False)
+        try:
+            removed = self.model.remove_keys(keys)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+        if removed:
+            self._flush_changed()
 
     def clear(self) -> None:
         """Remove every file from the queue and reset state."""
-        self.tree.clear()
-        self._items.clear()
-        self.files_changed.emit([])
+        self.model.reset_rows([])
+        self._flush_changed()
+
+    def _schedule_changed(self) -> None:
+        """Queue a files_changed emission unless one is already pending."""
+        if not self._changed_timer.isActive():
+            self._changed_timer.start()
+
+    def _flush_changed(self) -> None:
+        """Emit the current queue keys once for all changes since the last flush."""
+        self._changed_timer.stop()
+        self.files_changed.emit(self.model.keys())
 
     def _browse_files(self) -> None:
         """Open a file chooser dialog to add PDFs to the queue."""
@@ -257,25 +377,22 @@ class FileQueueWidget(QWidget):
 
     def _remove_selected(self) -> None:
         """Remove any highlighted entries from the queue."""
-        selected = [item.data(0, Qt.UserRole) for item in self.tree.selectedItems()]
-        for key in selected:
-            if key:
-                self.remove_file(key)
+        self.remove_files(self.selected_files())
 
     def selected_files(self) -> List[str]:
-        """Return the keys for the currently selected queue items."""
-        return [item.data(0, Qt.UserRole) for item in self.tree.selectedItems() if item]
+        """Return the keys for the currently selected queue rows."""
+        return [self.model.key_at(index.row()) for index in self.tree.selectionModel().selectedRows()]
 
     def all_files(self) -> List[str]:
         """Return all keys currently tracked by the queue."""
-        return list(self._items.keys())
+        return self.model.keys()
 
-    def _handle_item_double_clicked(self, item: QTreeWidgetItem, _column: int) -> None:
+    def _handle_double_clicked(self, index: QModelIndex) -> None:
         """Emit a retry request when the user double-clicks a failed entry."""
-        key = item.data(0, Qt.UserRole)
-        status_value = item.data(1, Qt.UserRole)
-        if key and status_value == TaskStatus.FAILED.value:
-            self.retry_requested.emit(key)
+        if not index.isValid():
+            return
+        if self.model.status_at(index.row()) == TaskStatus.FAILED:
+            self.retry_requested.emit(self.model.key_at(index.row()))
 
     def _handle_dropped_files(self, paths: List[str]) -> None:
         """Add files dropped from the OS file manager into the queue."""
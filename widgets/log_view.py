@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
-from PySide6.QtGui import QTextCursor
-from PySide6.QtWidgets import QPushButton, QVBoxLayout, QWidget, QPlainTextEdit
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from PySide6.QtCore import QMetaObject, Qt, QThread, QTimer, Signal
+from PySide6.QtWidgets import QFileDialog, QHBoxLayout, QPushButton, QVBoxLayout, QWidget, QPlainTextEdit
 
 
 class LogViewWidget(QWidget):
     """Simple log display with clear/export controls."""
 
+    # (path, error message or "" on success), emitted once an export finishes
+    export_finished = Signal(str, str)
+
+    MAX_BLOCKS = 5000
+    FLUSH_INTERVAL_MS = 33
+
     def __init__(self, parent=None) -> None:
         """Set up the log text area and supporting controls."""
         super().__init__(parent)
+        # Lines wait here until the next flush so a burst costs one document update.
+        self._buffer: deque[str] = deque()
+        self._buffer_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+        # Exports are written off the GUI thread; pool threads are joined on shutdown.
+        self._export_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mineru-log-export")
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -22,20 +43,78 @@ class LogViewWidget(QWidget):
         self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
         self.log_area.setMinimumHeight(160)
+        # The document drops its oldest lines past the limit instead of growing forever.
+        self.log_area.setMaximumBlockCount(self.MAX_BLOCKS)
         layout.addWidget(self.log_area)
 
+        button_row = QHBoxLayout()
         self.clear_button = QPushButton("清空日志")
-        self.clear_button.clicked.connect(self.log_area.clear)
-        layout.addWidget(self.clear_button)
+        self.clear_button.clicked.connect(self.clear)
+        button_row.addWidget(self.clear_button)
+
+        self.export_button = QPushButton("导出日志")
+        self.export_button.clicked.connect(self._browse_export_path)
+        button_row.addWidget(self.export_button)
+        layout.addLayout(button_row)
 
     def append(self, message: str) -> None:
-        """Append a new line of text and keep the view scrolled to the bottom."""
-        self.log_area.appendPlainText(message)
-        cursor = self.log_area.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.log_area.setTextCursor(cursor)
+        """Queue a line for the next flush; safe to call from any thread."""
+        with self._buffer_lock:
+            self._buffer.append(message)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        if QThread.currentThread() == self.thread():
+            self._flush_timer.start()
+        else:
+            QMetaObject.invokeMethod(self._flush_timer, "start", Qt.QueuedConnection)
+
+    def append_many(self, messages: Iterable[str]) -> None:
+        """Append several lines with a single document update."""
+        lines = list(messages)
+        if lines:
+            self.log_area.appendPlainText("\n".join(lines))
+
+    def flush(self) -> None:
+        """Write every queued line to the view at once."""
+        self._flush_timer.stop()
+        with self._buffer_lock:
+            lines = list(self._buffer)
+            self._buffer.clear()
+            self._flush_scheduled = False
+        self.append_many(lines)
+
+    def clear(self) -> None:
+        """Drop queued lines and empty the view."""
+        with self._buffer_lock:
+            self._buffer.clear()
+        self.log_area.clear()
 
     def export_to_file(self, path: str) -> None:
-        """Persist the current log contents to the specified file path."""
-        with open(path, "w", encoding="utf-8") as handle:
-            handle.write(self.log_area.toPlainText())
+        """Persist the current log contents to the specified file path in the background.
+
+        The text is snapshotted once on the GUI thread (the document is not thread-safe)
+        and written by the export worker; ``export_finished`` reports the outcome.
+        """
+        self.flush()
+        self._export_writer.submit(self._write_export, path, self.log_area.toPlainText())
+
+    def shutdown(self) -> None:
+        """Block until any running export has been written completely."""
+        self._export_writer.shutdown(wait=True)
+
+    def _write_export(self, path: str, text: str) -> None:
+        """Write a captured log snapshot to disk and report back."""
+        try:
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(text)
+        except OSError as exc:
+            self.export_finished.emit(path, str(exc))
+        else:
+            self.export_finished.emit(path, "")
+
+    def _browse_export_path(self) -> None:
+        """Ask for a destination file and export the log there."""
+        path, _ = QFileDialog.getSaveFileName(self, "导出日志", "mineru-log.txt", "文本文件 (*.txt)")
+        if path:
+            self.export_to_file(path)
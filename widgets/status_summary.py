@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtWidgets import QGridLayout, QLabel, QWidget
+from PySide6.QtWidgets import QGridLayout, QHBoxLayout, QLabel, QWidget
 
 
 class StatusSummaryWidget(QWidget):
@@ -11,6 +11,8 @@ class StatusSummaryWidget(QWidget):
     def __init__(self, parent=None) -> None:
         """Initialise labels and layout container."""
         super().__init__(parent)
+        # (total, completed, failed, pending) currently shown
+        self._last: tuple = (0, 0, 0, 0)
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -19,19 +21,31 @@ class StatusSummaryWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setHorizontalSpacing(24)
 
-        self.total_label = QLabel("总文件: 0")
-        self.completed_label = QLabel("完成: 0")
-        self.failed_label = QLabel("失败: 0")
-        self.pending_label = QLabel("进行中: 0")
-
-        layout.addWidget(self.total_label, 0, 0)
-        layout.addWidget(self.completed_label, 0, 1)
-        layout.addWidget(self.failed_label, 0, 2)
-        layout.addWidget(self.pending_label, 0, 3)
+        # Prefixes are static labels; only the numeric labels are ever updated.
+        self.total_label = self._add_count(layout, 0, "总文件: ")
+        self.completed_label = self._add_count(layout, 1, "完成: ")
+        self.failed_label = self._add_count(layout, 2, "失败: ")
+        self.pending_label = self._add_count(layout, 3, "进行中: ")
+        self._value_labels = (self.total_label, self.completed_label, self.failed_label, self.pending_label)
+
+    @staticmethod
+    def _add_count(layout: QGridLayout, column: int, prefix: str) -> QLabel:
+        """Place a prefix/value label pair in the grid and return the value label."""
+        cell = QHBoxLayout()
+        cell.setSpacing(0)
+        cell.addWidget(QLabel(prefix))
+        value_label = QLabel("0")
+        cell.addWidget(value_label)
+        cell.addStretch()
+        layout.addLayout(cell, 0, column)
+        return value_label
 
     def update_counts(self, total: int, completed: int, failed: int, pending: int) -> None:
-        """Update each label with the latest batch metrics."""
-        self.total_label.setText(f"总文件: {total}")
-        self.completed_label.setText(f"完成: {completed}")
-        self.failed_label.setText(f"失败: {failed}")
-        self.pending_label.setText(f"进行中: {pending}")
+        """Update the labels whose batch metrics changed since the last call."""
+        counts = (total, completed, failed, pending)
+        if counts == self._last:
+            return
+        for label, value, previous in zip(self._value_labels, counts, self._last):
+            if value != previous:
+                label.setText(str(value))
+        self._last = counts
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
@@ -24,6 +25,8 @@ STATUS_LABELS = {
     HistoryStatus.FAILED.value: "失败",
     HistoryStatus.UNKNOWN.value: "未知",
 }
+_RESUMABLE = frozenset({HistoryStatus.PROCESSING.value, HistoryStatus.UPLOADING.value, HistoryStatus.FAILED.value})
+_COMPLETED = HistoryStatus.COMPLETED.value
 
 
 class TaskHistoryWidget(QWidget):
@@ -36,6 +39,15 @@ class TaskHistoryWidget(QWidget):
         """Initialise storage and construct the history tree UI."""
         super().__init__(parent)
         self._entries: List[Dict] = []
+        # batch id -> tree row, so refreshes update rows in place instead of rebuilding
+        self._rows: Dict[str, QTreeWidgetItem] = {}
+        # batch id -> entry as handed out by the task manager (replaced, never mutated)
+        self._entry_by_id: Dict[str, Dict] = {}
+        # One click can fire several selection changes; evaluate the buttons once afterwards.
+        self._button_state_timer = QTimer(self)
+        self._button_state_timer.setSingleShot(True)
+        self._button_state_timer.setInterval(0)
+        self._button_state_timer.timeout.connect(self._update_button_state)
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -64,36 +76,22 @@ class TaskHistoryWidget(QWidget):
         self.tree.setColumnWidth(2, 160)
         self.tree.setColumnWidth(3, 60)
         self.tree.setColumnWidth(4, 60)
-        self.tree.setStyleSheet(
-            """
-            QTreeWidget {
-                selection-background-color: #24262a;
-                selection-color: #ffffff;
-            }
-            QTreeWidget::item:selected {
-                background-color: #1f6fb2;
-                color: #ffffff;
-            }
-            QTreeWidget::item:selected:active {
-                background-color: #4a90e2;
-                color: #ffffff;
-            }
-            QTreeWidget::item:selected:!active {
-                background-color: #1f3652;
-                color: #ffffff;
-            }
-            """
-        )
-        self.tree.itemSelectionChanged.connect(self._update_button_state)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setObjectName("taskHistoryTree")
+        self.tree.itemSelectionChanged.connect(self._button_state_timer.start)
         self.tree.itemDoubleClicked.connect(self._handle_double_click)
         layout.addWidget(self.tree)
 
     def update_history(self, entries: List[Dict]) -> None:
-        """Refresh the tree widget based on the provided history records."""
+        """Refresh the tree in place: update changed cells, add new rows, drop vanished ones."""
         self._entries = entries or []
-        selected_batch = self._current_selection_id()
-        self.tree.clear()
-        for entry in self._entries:
+        self._entry_by_id = {entry.get("batch_id", ""): entry for entry in self._entries}
+        batch_ids = self._entry_by_id.keys()
+        for batch_id in [batch_id for batch_id in self._rows if batch_id not in batch_ids]:
+            item = self._rows.pop(batch_id)
+            self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+
+        for position, entry in enumerate(self._entries):
             batch_id = entry.get("batch_id", "")
             status_value = entry.get("status", HistoryStatus.UNKNOWN.value)
             status_text = STATUS_LABELS.get(status_value, status_value)
@@ -101,36 +99,43 @@ class TaskHistoryWidget(QWidget):
             success = str(entry.get("success", 0))
             failed = str(entry.get("failed", 0))
             output_dir = entry.get("output_dir", "")
-
-            item = QTreeWidgetItem([batch_id, status_text, timestamp, success, failed, output_dir])
-            item.setData(0, Qt.UserRole, self._clone_entry(entry))
-            if entry.get("last_error"):
-                item.setToolTip(1, entry["last_error"])
-                item.setToolTip(0, entry["last_error"])
-            self.tree.addTopLevelItem(item)
-            if batch_id and batch_id == selected_batch:
-                item.setSelected(True)
+            texts = (batch_id, status_text, timestamp, success, failed, output_dir)
+
+            item = self._rows.get(batch_id)
+            if item is None:
+                item = QTreeWidgetItem(list(texts))
+                # Only the id lives on the item; Qt would copy a dict on every data() call.
+                item.setData(0, Qt.UserRole, batch_id)
+                self.tree.insertTopLevelItem(position, item)
+                self._rows[batch_id] = item
+            else:
+                for column, text in enumerate(texts):
+                    if item.text(column) != text:
+                        item.setText(column, text)
+                if self.tree.topLevelItem(position) is not item:
+                    # Rows only shift when batches are added or trimmed; move this one into place.
+                    selected = item.isSelected()
+                    self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+                    self.tree.insertTopLevelItem(position, item)
+                    item.setSelected(selected)
+            last_error = entry.get("last_error") or ""
+            if item.toolTip(0) != last_error:
+                item.setToolTip(1, last_error)
+                item.setToolTip(0, last_error)
 
         self._update_button_state()
 
-    def _current_selection_id(self) -> Optional[str]:
-        """Return the batch id of the currently selected tree row."""
-        items = self.tree.selectedItems()
-        if not items:
-            return None
-        entry = items[0].data(0, Qt.UserRole) or {}
-        return entry.get("batch_id")
-
-    def _selected_entry(self) -> Optional[Dict]:
-        """Return a cloned copy of the currently selected entry."""
+    def _selected_entry(self) -> Optional[Mapping]:
+        """Return a read-only view of the currently selected entry."""
         items = self.tree.selectedItems()
         if not items:
             return None
-        entry = items[0].data(0, Qt.UserRole)
-        return self._clone_entry(entry) if entry else None
+        entry = self._entry_by_id.get(items[0].data(0, Qt.UserRole))
+        return MappingProxyType(entry) if entry else None
 
     def _update_button_state(self) -> None:
         """Enable or disable action buttons based on selection state."""
+        self._button_state_timer.stop()
         entry = self._selected_entry()
         if not entry:
             self.resume_button.setEnabled(False)
@@ -138,18 +143,16 @@ class TaskHistoryWidget(QWidget):
             return
 
         status = entry.get("status", HistoryStatus.UNKNOWN.value)
-        self.resume_button.setEnabled(
-            status in {HistoryStatus.PROCESSING.value, HistoryStatus.UPLOADING.value, HistoryStatus.FAILED.value}
-        )
-        self.redownload_button.setEnabled(status == HistoryStatus.COMPLETED.value)
+        self.resume_button.setEnabled(status in _RESUMABLE)
+        self.redownload_button.setEnabled(status == _COMPLETED)
 
     def _handle_double_click(self, item: QTreeWidgetItem, _column: int) -> None:
         """Trigger the appropriate action when a row is double-clicked."""
-        entry = item.data(0, Qt.UserRole)
+        entry = self._entry_by_id.get(item.data(0, Qt.UserRole))
         if not entry:
             return
         status = entry.get("status", HistoryStatus.UNKNOWN.value)
-        if status == HistoryStatus.COMPLETED.value:
+        if status == _COMPLETED:
             self._emit_redownload()
         else:
             self._emit_resume()
@@ -158,16 +161,16 @@ class TaskHistoryWidget(QWidget):
         """Emit the resume signal for the currently selected entry."""
         entry = self._selected_entry()
         if entry:
-            self.resume_requested.emit(entry)
+            self.resume_requested.emit(self._clone_entry(entry))
 
     def _emit_redownload(self) -> None:
         """Emit the redownload signal for the currently selected entry."""
         entry = self._selected_entry()
         if entry:
-            self.redownload_requested.emit(entry)
+            self.redownload_requested.emit(self._clone_entry(entry))
 
-    def _clone_entry(self, entry: Optional[Dict]) -> Dict:
-        """Return a shallow copy of an entry to avoid accidental mutation."""
+    def _clone_entry(self, entry: Optional[Mapping]) -> Dict:
+        """Return a mutable shallow copy of an entry for signal consumers."""
         if not entry:
             return {}
         clone = dict(entry)